@@ -5,14 +5,25 @@ Extracts only the essential information: ID, Label, Type, Required, Options
 """
 
 import asyncio
+import functools
 import json
 import sys
 import logging
 import re
+import time
 from datetime import datetime
 from typing import List, Dict, Optional, Any
+from urllib.parse import urlparse
 from playwright.async_api import async_playwright, Page, ElementHandle
 from undetected_playwright import stealth_async
+from bs4 import BeautifulSoup
+
+# Try to use orjson for fast JSON serialization, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 import tempfile
@@ -40,6 +51,36 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Chromium flags for stealthy extraction; public so callers that share a
+# browser across extractions (e.g. the MCP server) launch it identically
+BROWSER_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding'
+]
+
+# Single-pass character map for normalizing option text into values
+# (replaces a chain of per-character .replace() calls)
+_VALUE_TRANS = str.maketrans({' ': '_', '/': '_', ',': None, '(': None, ')': None, '.': None})
+
+# Known ATS hosts mapped to their short domain identifiers
+_ATS_MARKERS = (('greenhouse', 'greenhouse'), ('workday', 'workday'), ('lever', 'lever'))
+_LOGO_RE = re.compile('logo', re.IGNORECASE)
+
+# Non-label text patterns combined into one regex so label validation does a
+# single C-level search instead of looping over the patterns in Python
+_INVALID_LABEL_RE = re.compile('|'.join(re.escape(p) for p in [
+    'select...', 'choose', 'attach', 'browse', 'upload',
+    'dropbox', 'google drive', 'enter manually',
+    'accepted file types', 'pdf', 'doc', 'docx'
+]))
+
 # Reduce noise from lower-level libraries while keeping our logs verbose
 for noisy in ['playwright._impl', 'asyncio', 'urllib3']:
     try:
@@ -51,7 +92,25 @@ class SimpleFormExtractor:
     def __init__(self, config=None):
         self.logger = logger
         self.iframe_context = None  # Store iframe information for JSON output
-        
+        # Cache of page-wide option candidates keyed by page URL so multiple
+        # dropdowns on the same page share a single fallback DOM scan
+        self._page_options_cache = {}
+        # Company-name probes precomputed as (selector, is_img) pairs so the
+        # per-page probe does no per-selector branching
+        self._company_probes = [
+            (sel, sel.startswith('img'))
+            for sel in ('.company-name', '[data-testid="company-name"]', 'img[alt*="Logo"]')
+        ]
+        # Company names already resolved this session, keyed by page origin,
+        # so re-visits (retries, batch runs) skip the selector sweep
+        self._company_cache = {}
+        # Parsed DOM snapshots per page so read-only helpers share one
+        # page.content() fetch instead of serializing the DOM each time
+        self._dom_snapshots = {}
+        # Presentation-only preview lines from the most recent extraction,
+        # kept off the returned form data so they are never serialized
+        self.last_preview = []
+
         # Configurable wait strategies and timeouts
         self.config = config or {}
         self.debug = bool(self.config.get('debug', True))
@@ -291,285 +350,307 @@ class SimpleFormExtractor:
         except Exception as e:
             self.logger.debug(f"Loading completion wait failed: {e}")
 
-    async def extract_form_data(self, url: str) -> Dict[str, Any]:
-        """Extract essential form data with clean, minimal output."""
+    async def extract_form_data(self, url: str, browser=None) -> Dict[str, Any]:
+        """Extract essential form data with clean, minimal output.
+
+        When ``browser`` is given the caller owns its lifecycle and each
+        extraction only pays for a fresh context; otherwise a dedicated
+        browser is launched and closed for this one URL.
+        """
+        if browser is not None:
+            return await self._extract_with_browser(browser, url, owns_browser=False)
+
         async with async_playwright() as p:
             # Launch browser with enhanced stealth mode for undetectability
             browser = await p.chromium.launch(
                 headless=False,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding'
-                ]
-            )
-            
-            # Set a viewport large enough to see most of the form
-            context = await browser.new_context(
-                viewport={'width': 1366, 'height': 960},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                extra_http_headers={
-                    'Accept-Language': 'en-US,en;q=0.9'
-                }
+                args=BROWSER_LAUNCH_ARGS
             )
-            page = await context.new_page()
-            
-            # Apply stealth mode to make the browser undetectable
-            await stealth_async(page)
-            # Attach debug listeners
-            self._attach_debug_listeners(page)
-            
-            try:
-                # Enhanced navigation and loading strategy
-                self.logger.info(f"Navigating to: {url}")
-                await self._save_debug_artifact(page, 'before_navigation')
-                
-                # Navigate with better error handling and retry logic
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        response = await page.goto(url, timeout=self.timeouts['navigation'], wait_until='domcontentloaded')
-                        if response:
-                            status = response.status
-                            self.logger.info(f"Navigation response status: {status}")
-                            if status >= 400:
-                                self.logger.warning(f"HTTP {status} response, but proceeding")
-                        break
-                    except Exception as nav_error:
-                        self.logger.warning(f"Navigation attempt {attempt + 1} failed: {nav_error}")
-                        if attempt < max_retries - 1:
-                            await self._smart_wait(page, 'medium')
-                            continue
-                        else:
-                            self.logger.warning("All navigation attempts failed, but proceeding")
-                
-                await self._log_iframes(page, 'post-navigation')
-                # Skip debug artifact for speed
-                
-                # Simplified fast page waiting strategy
-                await page.wait_for_load_state('domcontentloaded', timeout=8000)  # Reduced timeout
-                # Skip enhanced waiting for speed
-                
-                # Check if page is still alive
-                try:
-                    await page.evaluate('document.readyState')
-                except Exception:
-                    raise Exception("Page closed unexpectedly during navigation")
-                
-                # Quick check for basic loading indicators only
+            return await self._extract_with_browser(browser, url, owns_browser=True)
+
+    async def _extract_with_browser(self, browser, url: str, owns_browser: bool = True) -> Dict[str, Any]:
+        """Run one extraction in a fresh context on the given browser."""
+        # Set a viewport large enough to see most of the form
+        context = await browser.new_context(
+            viewport={'width': 1366, 'height': 960},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+            extra_http_headers={
+                'Accept-Language': 'en-US,en;q=0.9'
+            }
+        )
+        page = await context.new_page()
+
+        # Apply stealth mode to make the browser undetectable
+        await stealth_async(page)
+        # Attach debug listeners
+        self._attach_debug_listeners(page)
+
+        try:
+            # Enhanced navigation and loading strategy
+            self.logger.info(f"Navigating to: {url}")
+            await self._save_debug_artifact(page, 'before_navigation')
+
+            # Navigate with better error handling and retry logic
+            max_retries = 3
+            for attempt in range(max_retries):
                 try:
-                    # Just check most common loading indicators with short timeout
-                    loading_selectors = ['.loading', '.spinner', '.loader']
-                    
-                    for selector in loading_selectors:
-                        try:
-                            await page.wait_for_selector(selector, state='detached', timeout=800)  # Further reduced
-                            self.logger.debug(f"Loading indicator {selector} disappeared")
-                        except Exception:
-                            pass  # Not found or didn't disappear
-                    
-                    # Quick check for basic content elements
+                    response = await page.goto(url, timeout=self.timeouts['navigation'], wait_until='domcontentloaded')
+                    if response:
+                        status = response.status
+                        self.logger.info(f"Navigation response status: {status}")
+                        if status >= 400:
+                            self.logger.warning(f"HTTP {status} response, but proceeding")
+                    break
+                except Exception as nav_error:
+                    self.logger.warning(f"Navigation attempt {attempt + 1} failed: {nav_error}")
+                    if attempt < max_retries - 1:
+                        await self._smart_wait(page, 'medium')
+                        continue
+                    else:
+                        self.logger.warning("All navigation attempts failed, but proceeding")
+
+            await self._log_iframes(page, 'post-navigation')
+            # Skip debug artifact for speed
+
+            # Simplified fast page waiting strategy
+            await page.wait_for_load_state('domcontentloaded', timeout=8000)  # Reduced timeout
+            # Skip enhanced waiting for speed
+
+            # Check if page is still alive
+            try:
+                await page.evaluate('document.readyState')
+            except Exception:
+                raise Exception("Page closed unexpectedly during navigation")
+
+            # Quick check for basic loading indicators only
+            try:
+                # Just check most common loading indicators with short timeout
+                loading_selectors = ['.loading', '.spinner', '.loader']
+
+                for selector in loading_selectors:
                     try:
-                        await page.wait_for_selector('input, textarea, select, button', timeout=1500)  # Check for any form element
-                        self.logger.debug(f"Form content found")
+                        await page.wait_for_selector(selector, state='detached', timeout=800)  # Further reduced
+                        self.logger.debug(f"Loading indicator {selector} disappeared")
                     except Exception:
-                        pass  # No form elements found quickly
-                    
-                    # Skip networkidle wait for speed - forms don't need it
-                    self.logger.debug("Skipping networkidle wait for speed")
-                        
-                except Exception as wait_error:
-                    self.logger.debug(f"Enhanced wait strategy warning: {wait_error}")
-                    # Quick fallback wait
-                    await page.wait_for_timeout(2000)  # Reduced from 5000
-                
-                # Check if page is still alive after waiting
+                        pass  # Not found or didn't disappear
+
+                # Quick check for basic content elements
                 try:
-                    page_title = await page.title()
-                    self.logger.info(f"Page title: {page_title}")
+                    await page.wait_for_selector('input, textarea, select, button', timeout=1500)  # Check for any form element
+                    self.logger.debug(f"Form content found")
                 except Exception:
-                    raise Exception("Page closed unexpectedly during wait")
-                
-                # Enhanced cookie banner and overlay handling
-                await self._dismiss_overlays(page)
-                
-                # Wait for any UI animations to complete using smart wait
-                await self._smart_wait(page, 'medium')
-                
-                # Check for iframe with Greenhouse form or find the form section
-                form_page = await self._find_form_page(page)
-                
-                # Get the specific form container element if found
-                form_container = self.iframe_context.get("form_container")
-                
-                # Extract all form fields
-                fields = []
-                
-                # Try one more time to find the form container if not already found
-                if not form_container and form_page == page:  # Only for main page, not iframes
+                    pass  # No form elements found quickly
+
+                # Skip networkidle wait for speed - forms don't need it
+                self.logger.debug("Skipping networkidle wait for speed")
+
+            except Exception as wait_error:
+                self.logger.debug(f"Enhanced wait strategy warning: {wait_error}")
+                # Quick fallback wait
+                await page.wait_for_timeout(2000)  # Reduced from 5000
+
+            # Check if page is still alive after waiting
+            try:
+                page_title = await page.title()
+                self.logger.info(f"Page title: {page_title}")
+            except Exception:
+                raise Exception("Page closed unexpectedly during wait")
+
+            # Enhanced cookie banner and overlay handling
+            await self._dismiss_overlays(page)
+
+            # Wait for any UI animations to complete using smart wait
+            await self._smart_wait(page, 'medium')
+
+            # Check for iframe with Greenhouse form or find the form section
+            form_page = await self._find_form_page(page)
+
+            # Get the specific form container element if found
+            form_container = self.iframe_context.get("form_container")
+
+            # Extract all form fields
+            fields = []
+
+            # Try one more time to find the form container if not already found
+            if not form_container and form_page == page:  # Only for main page, not iframes
+                try:
+                    # Look for the most likely form container
+                    form_containers = await form_page.query_selector_all('form, [class*="application-form"], [id="apply-form"], [class*="job-form"], [class*="apply-form"], .application-form, [id="apply"], [id="applynow"]')
+
+                    # Find the container with the most input elements
+                    best_container = None
+                    max_inputs = 0
+
+                    for container in form_containers:
+                        inputs = await container.query_selector_all('input, textarea, select, [role="combobox"]')
+                        if len(inputs) > max_inputs:
+                            max_inputs = len(inputs)
+                            best_container = container
+
+                    if best_container and max_inputs >= 3:
+                        self.logger.info(f"Found form container with {max_inputs} input elements")
+                        form_container = best_container
+                        await form_container.scroll_into_view_if_needed()
+                        self.iframe_context["form_container"] = form_container
+                except Exception as e:
+                    self.logger.debug(f"Error finding form container: {e}")
+
+            # Use the context for extraction - form container if available, otherwise the whole page
+            extraction_context = form_container if form_container else form_page
+            self.logger.info(f"Using {'form container' if form_container else 'full page'} for field extraction")
+
+            # Phone fields (composite country+phone patterns) - extract these first
+            phone_fields = await self._extract_phone_fields(form_page, extraction_context)
+            fields.extend(phone_fields)
+            self.logger.info(f"Extracted {len(phone_fields)} phone fields")
+
+            # Text inputs - now extracted only from the form container if available
+            text_fields = await self._extract_text_fields(form_page, extraction_context, phone_fields)
+            fields.extend(text_fields)
+            self.logger.info(f"Extracted {len(text_fields)} text fields")
+
+            # Dropdowns
+            dropdown_fields = await self._extract_dropdown_fields(form_page, extraction_context, phone_fields)
+            fields.extend(dropdown_fields)
+            self.logger.info(f"Extracted {len(dropdown_fields)} dropdown fields")
+
+            # File inputs
+            file_fields = await self._extract_file_fields(form_page, extraction_context)
+            fields.extend(file_fields)
+            self.logger.info(f"Extracted {len(file_fields)} file fields")
+
+            # Textareas
+            textarea_fields = await self._extract_textarea_fields(form_page, extraction_context)
+            fields.extend(textarea_fields)
+            self.logger.info(f"Extracted {len(textarea_fields)} textarea fields")
+
+            # Checkbox groups (for demographics sections like Instacart)
+            checkbox_fields = await self._extract_checkbox_groups(form_page, extraction_context)
+            fields.extend(checkbox_fields)
+            self.logger.info(f"Extracted {len(checkbox_fields)} checkbox group fields")
+
+            # If we didn't find any fields, try a few other strategies
+            if len(fields) == 0:
+                self.logger.warning("No fields found with primary strategy, trying alternative approaches")
+
+                # Strategy 1: Try to find any visible inputs on the page
+                all_inputs = await form_page.query_selector_all('input, textarea, select, [role="combobox"]')
+                visible_inputs = []
+
+                for input_elem in all_inputs:
                     try:
-                        # Look for the most likely form container
-                        form_containers = await form_page.query_selector_all('form, [class*="application-form"], [id="apply-form"], [class*="job-form"], [class*="apply-form"], .application-form, [id="apply"], [id="applynow"]')
-                        
-                        # Find the container with the most input elements
-                        best_container = None
-                        max_inputs = 0
-                        
-                        for container in form_containers:
-                            inputs = await container.query_selector_all('input, textarea, select, [role="combobox"]')
-                            if len(inputs) > max_inputs:
-                                max_inputs = len(inputs)
-                                best_container = container
-                        
-                        if best_container and max_inputs >= 3:
-                            self.logger.info(f"Found form container with {max_inputs} input elements")
-                            form_container = best_container
-                            await form_container.scroll_into_view_if_needed()
-                            self.iframe_context["form_container"] = form_container
-                    except Exception as e:
-                        self.logger.debug(f"Error finding form container: {e}")
-                
-                # Use the context for extraction - form container if available, otherwise the whole page
-                extraction_context = form_container if form_container else form_page
-                self.logger.info(f"Using {'form container' if form_container else 'full page'} for field extraction")
-                
-                # Phone fields (composite country+phone patterns) - extract these first
-                phone_fields = await self._extract_phone_fields(form_page, extraction_context)
-                fields.extend(phone_fields)
-                self.logger.info(f"Extracted {len(phone_fields)} phone fields")
-                
-                # Text inputs - now extracted only from the form container if available
-                text_fields = await self._extract_text_fields(form_page, extraction_context, phone_fields)
-                fields.extend(text_fields)
-                self.logger.info(f"Extracted {len(text_fields)} text fields")
-                
-                # Dropdowns
-                dropdown_fields = await self._extract_dropdown_fields(form_page, extraction_context, phone_fields)
-                fields.extend(dropdown_fields)
-                self.logger.info(f"Extracted {len(dropdown_fields)} dropdown fields")
-                
-                # File inputs
-                file_fields = await self._extract_file_fields(form_page, extraction_context)
-                fields.extend(file_fields)
-                self.logger.info(f"Extracted {len(file_fields)} file fields")
-                
-                # Textareas
-                textarea_fields = await self._extract_textarea_fields(form_page, extraction_context)
-                fields.extend(textarea_fields)
-                self.logger.info(f"Extracted {len(textarea_fields)} textarea fields")
-                
-                # Checkbox groups (for demographics sections like Instacart)
-                checkbox_fields = await self._extract_checkbox_groups(form_page, extraction_context)
-                fields.extend(checkbox_fields)
-                self.logger.info(f"Extracted {len(checkbox_fields)} checkbox group fields")
-                
-                # If we didn't find any fields, try a few other strategies
-                if len(fields) == 0:
-                    self.logger.warning("No fields found with primary strategy, trying alternative approaches")
-                    
-                    # Strategy 1: Try to find any visible inputs on the page
-                    all_inputs = await form_page.query_selector_all('input, textarea, select, [role="combobox"]')
-                    visible_inputs = []
-                    
-                    for input_elem in all_inputs:
+                        box = await input_elem.bounding_box()
+                        if box and box['width'] > 0 and box['height'] > 0:
+                            visible_inputs.append(input_elem)
+                    except:
+                        pass
+
+                if visible_inputs:
+                    self.logger.info(f"Found {len(visible_inputs)} visible input elements")
+
+                    # Try to extract information from these inputs
+                    for input_elem in visible_inputs:
                         try:
-                            box = await input_elem.bounding_box()
-                            if box and box['width'] > 0 and box['height'] > 0:
-                                visible_inputs.append(input_elem)
-                        except:
-                            pass
-                    
-                    if visible_inputs:
-                        self.logger.info(f"Found {len(visible_inputs)} visible input elements")
-                        
-                        # Try to extract information from these inputs
-                        for input_elem in visible_inputs:
-                            try:
-                                input_type = await input_elem.get_attribute('type')
-                                id_attr = await input_elem.get_attribute('id')
-                                name_attr = await input_elem.get_attribute('name')
-                                
-                                if not input_type:
-                                    tag_name = await input_elem.evaluate('el => el.tagName.toLowerCase()')
-                                    if tag_name == 'textarea':
-                                        input_type = 'textarea'
-                                    elif tag_name == 'select':
-                                        input_type = 'select'
-                                
-                                # Try to get a label
-                                label = await self._get_real_label(form_page, input_elem, id_attr)
-                                if not label and name_attr:
-                                    # Use name as fallback
-                                    label = name_attr.replace('_', ' ').replace('-', ' ').capitalize()
-                                
-                                # Determine if required
-                                required = await self._is_required(form_page, input_elem, id_attr)
-                                
-                                if label and (input_type or id_attr or name_attr):
-                                    field_type = 'text'
-                                    if input_type == 'file':
-                                        field_type = 'file'
-                                    elif input_type == 'textarea':
-                                        field_type = 'textarea'
-                                    elif input_type in ['select', 'select-one']:
-                                        field_type = 'dropdown'
-                                    
-                                    fields.append({
-                                        'id': id_attr or '',
-                                        'name': name_attr or '',
-                                        'label': label,
-                                        'type': field_type,
-                                        'required': required
-                                    })
-                            except Exception as e:
-                                self.logger.debug(f"Error processing input: {e}")
-                
-                # Clean and deduplicate
-                clean_fields = self._clean_and_dedupe_fields(fields)
-                
-                # Generate user input template
-                user_template = self._generate_user_input_template(clean_fields)
-                
-                # Extract job info (try both main page and form page)
-                job_title = await self._extract_job_title(page) or await self._extract_job_title(form_page)
-                company = await self._extract_company(page) or await self._extract_company(form_page)
-                
-                # Create a copy of iframe_context without the form_container element
-                # as ElementHandle objects cannot be serialized to JSON
-                form_context = {k: v for k, v in self.iframe_context.items() if k != "form_container"}
-                
-                return {
-                    'url': url,
-                    'timestamp': datetime.now().isoformat(),
-                    'job_title': job_title,
-                    'company': company,
-                    'form_context': form_context,
-                    'total_fields': len(clean_fields),
-                    'required_fields': len([f for f in clean_fields if f.get('required', False)]),
-                    'fields': clean_fields,
-                    'user_input_template': user_template
-                }
-                
-            except Exception as e:
-                self.logger.error(f"Error during form extraction: {e}")
-                # Try to get more context about the error
-                try:
-                    page_url = await page.url()
-                    self.logger.info(f"Error occurred on page: {page_url}")
-                except:
-                    pass
-                raise
-            finally:
+                            input_type = await input_elem.get_attribute('type')
+                            id_attr = await input_elem.get_attribute('id')
+                            name_attr = await input_elem.get_attribute('name')
+
+                            if not input_type:
+                                tag_name = await input_elem.evaluate('el => el.tagName.toLowerCase()')
+                                if tag_name == 'textarea':
+                                    input_type = 'textarea'
+                                elif tag_name == 'select':
+                                    input_type = 'select'
+
+                            # Try to get a label
+                            label = await self._get_real_label(form_page, input_elem, id_attr)
+                            if not label and name_attr:
+                                # Use name as fallback
+                                label = name_attr.replace('_', ' ').replace('-', ' ').capitalize()
+
+                            # Determine if required
+                            required = await self._is_required(form_page, input_elem, id_attr)
+
+                            if label and (input_type or id_attr or name_attr):
+                                field_type = 'text'
+                                if input_type == 'file':
+                                    field_type = 'file'
+                                elif input_type == 'textarea':
+                                    field_type = 'textarea'
+                                elif input_type in ['select', 'select-one']:
+                                    field_type = 'dropdown'
+
+                                fields.append({
+                                    'id': id_attr or '',
+                                    'name': name_attr or '',
+                                    'label': label,
+                                    'type': field_type,
+                                    'required': required
+                                })
+                        except Exception as e:
+                            self.logger.debug(f"Error processing input: {e}")
+
+            # Clean and deduplicate
+            clean_fields = self._clean_and_dedupe_fields(fields)
+
+            # Generate user input template
+            user_template = self._generate_user_input_template(clean_fields)
+
+            # Extract job info (try both main page and form page)
+            job_title = await self._extract_job_title(page) or await self._extract_job_title(form_page)
+            company = await self._extract_company(page) or await self._extract_company(form_page)
+
+            # Create a copy of iframe_context without the form_container element
+            # as ElementHandle objects cannot be serialized to JSON
+            form_context = {k: v for k, v in self.iframe_context.items() if k != "form_container"}
+
+            # Single pass over fields: count required and build the preview lines
+            required_count = 0
+            preview = []
+            for i, field in enumerate(clean_fields, 1):
+                if field.get('required', False):
+                    required_count += 1
+                if i <= 5:
+                    req_indicator = " *" if field.get('required') else ""
+                    options_info = f" ({len(field.get('options', []))} options)" if field.get('options') else ""
+                    preview.append(f"  {i}. {field['label']} ({field['type']}){req_indicator}{options_info}")
+            # Stashed on the instance rather than returned: the form data
+            # dict is persisted as-is by its callers
+            self.last_preview = preview
+
+            return {
+                'url': url,
+                'timestamp': datetime.now().isoformat(),
+                'job_title': job_title,
+                'company': company,
+                'form_context': form_context,
+                'total_fields': len(clean_fields),
+                'required_fields': required_count,
+                'fields': clean_fields,
+                'user_input_template': user_template
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error during form extraction: {e}")
+            # Try to get more context about the error
+            try:
+                page_url = await page.url()
+                self.logger.info(f"Error occurred on page: {page_url}")
+            except:
+                pass
+            raise
+        finally:
+            if owns_browser:
                 try:
                     await browser.close()
                 except Exception as close_error:
                     self.logger.debug(f"Error closing browser: {close_error}")
+            else:
+                # Shared browser stays up; only this URL's context goes away
+                try:
+                    await context.close()
+                except Exception as close_error:
+                    self.logger.debug(f"Error closing context: {close_error}")
 
     def _extract_domain_from_src(self, src: str) -> str:
         """Extract domain from iframe src URL for selector creation."""
@@ -1966,17 +2047,16 @@ class SimpleFormExtractor:
                             except Exception as e:
                                 self.logger.debug(f"Error tracking file input: {e}")
                         
-                        # Extract the main label from the group
-                        label = await self._extract_file_group_label(group)
-                        
+                        # Fetch all group metadata in one round-trip, then derive
+                        # the label, upload options, and accepted types from it
+                        group_meta = await self._extract_file_group_meta(group)
+                        label = self._extract_file_group_label(group_meta)
+
                         # Check if required
                         required = '*' in group_text or 'required' in group_text_lower
-                        
-                        # Extract upload options
-                        upload_options = await self._extract_upload_options(group)
-                        
-                        # Get accepted file types
-                        accepted_types = await self._extract_accepted_types(group)
+
+                        upload_options = self._extract_upload_options(group_meta)
+                        accepted_types = self._extract_accepted_types(group_meta)
                         
                         if label:
                             field_id = label.lower().replace(' ', '_').replace('/', '_')
@@ -2317,11 +2397,12 @@ class SimpleFormExtractor:
                                             elem_text = await elem.text_content()
                                             if elem_text and elem_text.strip():
                                                 text = elem_text.strip()
+                                                text_lower = text.lower()
                                                 # Skip navigation items, long text, etc.
-                                                if (len(text) < 100 and 
-                                                    text.lower() not in ['see all jobs', 'your settings', 'view favorites', 'add to favorites'] and
-                                                    'navigation' not in text.lower() and
-                                                    'menu' not in text.lower()):
+                                                if (len(text) < 100 and
+                                                    text_lower not in ['see all jobs', 'your settings', 'view favorites', 'add to favorites'] and
+                                                    text_lower.find('navigation') == -1 and
+                                                    text_lower.find('menu') == -1):
                                                     filtered_elements.append(elem)
                                         
                                         if filtered_elements:
@@ -2337,41 +2418,70 @@ class SimpleFormExtractor:
                 if option_elements:
                     break
             
-            # If we couldn't find options within a container, look for visible options near the dropdown
+            # If we couldn't find options within a container, look for visible options near the dropdown.
+            # One page.evaluate scans all option selectors browser-side (rejecting long text and
+            # navigation chrome before anything crosses IPC) and the result is cached per URL so
+            # every dropdown on the same page reuses a single DOM pass.
             if not option_elements:
-                for selector in option_selectors:
-                    elements = await page.query_selector_all(selector)
-                    if elements and len(elements) > 0:
-                        # Filter by proximity and content
-                        filtered_elements = []
-                        for elem in elements:
-                            try:
-                                elem_box = await elem.bounding_box()
-                                elem_text = await elem.text_content()
-                                
-                                if elem_box and elem_text and elem_text.strip():
-                                    text = elem_text.strip()
-                                    
-                                    # Skip if too far from dropdown
-                                    if dropdown_box:
-                                        distance = abs(elem_box['y'] - dropdown_box['y']) + abs(elem_box['x'] - dropdown_box['x'])
-                                        if distance > 500:
-                                            continue
-                                    
-                                    # Skip navigation items and other non-dropdown text
-                                    if (len(text) < 100 and 
-                                        text.lower() not in ['see all jobs', 'your settings', 'view favorites', 'add to favorites'] and
-                                        'navigation' not in text.lower() and
-                                        'menu' not in text.lower() and
-                                        'footer' not in text.lower()):
-                                        filtered_elements.append(elem)
-                            except Exception:
-                                continue
-                        
-                        if filtered_elements:
-                            self.logger.debug(f"Found {len(filtered_elements)} filtered options with selector: {selector}")
-                            option_elements = filtered_elements
-                            break
+                page_url = getattr(page, 'url', '') or ''
+                candidates = self._page_options_cache.get(page_url)
+
+                if candidates is None:
+                    try:
+                        candidates = await page.evaluate('''(selector) => {
+                            const out = [];
+                            for (const el of document.querySelectorAll(selector)) {
+                                if (el.closest('nav, header, footer, [role="navigation"]')) continue;
+                                const text = (el.textContent || '').trim();
+                                if (!text || text.length >= 100) continue;
+                                const rect = el.getBoundingClientRect();
+                                out.push({
+                                    text: text,
+                                    value: el.getAttribute('value') ||
+                                           el.getAttribute('data-value') ||
+                                           el.getAttribute('data-option-value'),
+                                    x: rect.x + window.scrollX,
+                                    y: rect.y + window.scrollY
+                                });
+                            }
+                            return out;
+                        }''', ', '.join(option_selectors))
+                    except Exception as scan_error:
+                        self.logger.debug(f"Page-wide option scan failed: {scan_error}")
+                        candidates = []
+
+                    self.logger.debug(f"Cached {len(candidates)} page-wide option candidates")
+                    self._page_options_cache[page_url] = candidates
+
+                # Filter the cached candidates by proximity and content for this dropdown
+                for cand in candidates:
+                    # Skip if too far from dropdown
+                    if dropdown_box:
+                        distance = abs(cand['y'] - dropdown_box['y']) + abs(cand['x'] - dropdown_box['x'])
+                        if distance > 500:
+                            continue
+
+                    clean_text = cand['text']
+                    text_lower = clean_text.lower()
+
+                    # Skip placeholder options, navigation items, and other non-dropdown text
+                    if text_lower in ['select...', 'choose...', 'select an option',
+                                      'see all jobs', 'your settings', 'view favorites', 'add to favorites',
+                                      'home', 'about', 'contact']:
+                        continue
+                    if (text_lower.find('navigation') != -1 or
+                            text_lower.find('menu') != -1 or
+                            text_lower.find('footer') != -1):
+                        continue
+
+                    clean_value = cand['value'] or text_lower.translate(_VALUE_TRANS)
+                    options.append({
+                        'text': clean_text,
+                        'value': clean_value
+                    })
+
+                if options:
+                    self.logger.debug(f"Built {len(options)} options from cached page-wide candidates")
             
             # Process found options
             for i, option_elem in enumerate(option_elements):
@@ -2395,7 +2505,7 @@ class SimpleFormExtractor:
                         if len(clean_text) > 100:
                             continue
                             
-                        clean_value = value or clean_text.lower().replace(' ', '_').replace(',', '').replace('(', '').replace(')', '').replace('.', '').replace('/', '_')
+                        clean_value = value or clean_text.lower().translate(_VALUE_TRANS)
                         
                         options.append({
                             'text': clean_text,
@@ -2543,9 +2653,10 @@ class SimpleFormExtractor:
                     if not parent:
                         break
                     
-                    # Check for asterisk in this container
-                    asterisk_elem = await parent.query_selector('*:has-text("*")')
-                    if asterisk_elem:
+                    # Check for asterisk in this container with a plain text scan,
+                    # which is much cheaper than a :has-text() subtree search
+                    has_star = await parent.evaluate('p => p.textContent.includes("*")')
+                    if has_star:
                         return True
                     
                     current = parent
@@ -2557,32 +2668,51 @@ class SimpleFormExtractor:
         except Exception:
             return False
 
-    async def _extract_file_group_label(self, group: ElementHandle) -> Optional[str]:
-        """Extract the main label from a file upload group."""
+    async def _extract_file_group_meta(self, group: ElementHandle) -> Dict[str, Any]:
+        """Collect all file-group metadata (labels, buttons, accept attr) in one round-trip."""
         try:
-            # First, try to get the group's accessible name or title
-            aria_label = await group.get_attribute('aria-label')
+            meta = await group.evaluate('''(g) => {
+                const headingSelectors = ['legend', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'label', '[role="heading"]'];
+                const headings = [];
+                for (const sel of headingSelectors) {
+                    const el = g.querySelector(sel);
+                    headings.push(el ? el.textContent.trim() : null);
+                }
+                const fileInput = g.querySelector('input[type="file"]');
+                return {
+                    aria_label: g.getAttribute('aria-label'),
+                    headings: headings,
+                    all_text: g.textContent,
+                    buttons: Array.from(g.querySelectorAll('button')).map(b => b.textContent.trim()),
+                    accept: fileInput ? fileInput.getAttribute('accept') : null
+                };
+            }''')
+            return meta or {}
+        except Exception as e:
+            self.logger.debug(f"Error extracting file group metadata: {e}")
+            return {}
+
+    def _extract_file_group_label(self, meta: Dict[str, Any]) -> Optional[str]:
+        """Extract the main label from pre-fetched file upload group metadata."""
+        try:
+            # First, try the group's accessible name or title
+            aria_label = meta.get('aria_label')
             if aria_label and aria_label.strip():
                 clean_label = self._clean_label(aria_label.strip())
                 if clean_label:
                     self.logger.debug(f"Found aria-label: {clean_label}")
                     return clean_label
-            
-            # Look for the main heading/label in the group
-            label_selectors = ['legend', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'label', '[role="heading"]']
-            
-            for selector in label_selectors:
-                label_elem = await group.query_selector(selector)
-                if label_elem:
-                    text = await label_elem.text_content()
-                    if text and text.strip():
-                        clean_text = self._clean_label(text.strip())
-                        if clean_text and not any(skip in clean_text.lower() for skip in ['attach', 'dropbox', 'google drive', 'enter manually']):
-                            self.logger.debug(f"Found label from {selector}: {clean_text}")
-                            return clean_text
-            
+
+            # Look at the main heading/label candidates from the group
+            for text in meta.get('headings') or []:
+                if text and text.strip():
+                    clean_text = self._clean_label(text.strip())
+                    if clean_text and not any(skip in clean_text.lower() for skip in ['attach', 'dropbox', 'google drive', 'enter manually']):
+                        self.logger.debug(f"Found label from heading: {clean_text}")
+                        return clean_text
+
             # Try to extract from group structure - look for direct text children
-            all_text = await group.text_content()
+            all_text = meta.get('all_text')
             if all_text:
                 lines = [line.strip() for line in all_text.split('\n') if line.strip()]
                 
@@ -2615,26 +2745,18 @@ class SimpleFormExtractor:
             self.logger.debug(f"Error extracting file group label: {e}")
             return None
 
-    async def _extract_upload_options(self, group: ElementHandle) -> List[str]:
-        """Extract available upload options from a file upload group."""
+    def _extract_upload_options(self, meta: Dict[str, Any]) -> List[str]:
+        """Extract available upload options from pre-fetched file upload group metadata."""
         try:
             options = []
-            
+
             # Look for buttons that indicate upload methods
-            buttons = await group.query_selector_all('button')
-            
-            for button in buttons:
-                try:
-                    button_text = await button.text_content()
-                    if button_text and button_text.strip():
-                        text = button_text.strip()
-                        if any(option in text.lower() for option in ['attach', 'dropbox', 'google drive', 'enter manually', 'browse', 'upload']):
-                            options.append(text)
-                except:
-                    continue
-            
+            for text in meta.get('buttons') or []:
+                if text and any(option in text.lower() for option in ['attach', 'dropbox', 'google drive', 'enter manually', 'browse', 'upload']):
+                    options.append(text)
+
             # Also check for text mentions of these options
-            all_text = await group.text_content()
+            all_text = meta.get('all_text')
             if all_text:
                 text_lower = all_text.lower()
                 possible_options = ['Attach', 'Dropbox', 'Google Drive', 'Enter manually']
@@ -2648,28 +2770,26 @@ class SimpleFormExtractor:
             self.logger.debug(f"Error extracting upload options: {e}")
             return []
 
-    async def _extract_accepted_types(self, group: ElementHandle) -> Optional[str]:
-        """Extract accepted file types from a file upload group."""
+    def _extract_accepted_types(self, meta: Dict[str, Any]) -> Optional[str]:
+        """Extract accepted file types from pre-fetched file upload group metadata."""
         try:
-            all_text = await group.text_content()
-            if all_text and 'accepted file types' in all_text.lower():
+            all_text = meta.get('all_text')
+            if all_text and all_text.lower().find('accepted file types') != -1:
                 # Find the line with accepted file types
                 lines = all_text.split('\n')
                 for line in lines:
-                    if 'accepted file types' in line.lower():
+                    if line.lower().find('accepted file types') != -1:
                         # Extract the file types part
                         parts = line.split(':')
                         if len(parts) > 1:
                             types_part = parts[1].strip()
                             return types_part
-            
-            # Look for input[accept] in the group
-            file_input = await group.query_selector('input[type="file"]')
-            if file_input:
-                accept = await file_input.get_attribute('accept')
-                if accept:
-                    return accept
-            
+
+            # Fall back to the input[accept] attribute captured from the group
+            accept = meta.get('accept')
+            if accept:
+                return accept
+
             return None
             
         except Exception as e:
@@ -2697,68 +2817,47 @@ class SimpleFormExtractor:
         """Check if text is a valid label (not just random text)."""
         if not text or len(text) < 3:
             return False
-        
-        # Skip common non-label text
-        skip_patterns = [
-            'select...', 'choose', 'attach', 'browse', 'upload',
-            'dropbox', 'google drive', 'enter manually',
-            'accepted file types', 'pdf', 'doc', 'docx'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in skip_patterns:
-            if pattern in text_lower:
-                return False
-        
+
+        # Skip common non-label text (single pass over the combined pattern regex)
+        if _INVALID_LABEL_RE.search(text.lower()):
+            return False
+
         # Good labels usually contain questions or descriptive text
         return len(text.split()) >= 2 or '?' in text or text.isupper()
 
     def _clean_and_dedupe_fields(self, fields: List[Dict]) -> List[Dict]:
         """Remove duplicates and clean field data."""
-        seen = {}
+        seen = {}            # canonical identifier -> field
+        alias_to_canon = {}  # normalized label -> canonical identifier
         clean_fields = []
-        
+
         for field in fields:
-            # Create identifier for deduplication
-            # Primary identifier: ID if it exists and is not empty
-            # Secondary identifier: label (cleaned)
-            # This ensures we catch duplicates even when IDs are missing
-            
+            # Create one canonical identifier per field (ID, then name, then
+            # normalized label) plus a label alias so duplicates are caught
+            # even when the same field shows up with different IDs
+
             id_attr = field.get('id', '').strip()
             name_attr = field.get('name', '').strip()
             label = field.get('label', '').strip()
-            
-            # Use ID if available, otherwise use cleaned label as identifier
-            if id_attr:
-                primary_identifier = id_attr
-            elif name_attr:
-                primary_identifier = name_attr
-            else:
-                # Use label but clean it to handle slight variations
-                primary_identifier = self._normalize_label_for_deduplication(label)
-            
-            # Also create a label-based identifier to catch cases where 
-            # the same field has different IDs but same label
+
             label_identifier = self._normalize_label_for_deduplication(label)
-            
+
             # Special handling for file fields
             if field.get('type') == 'file':
-                primary_identifier = label_identifier + '_file'
                 label_identifier = label_identifier + '_file'
-            
-            # Check if we've seen this field before (by either identifier)
-            existing_field = None
-            existing_key = None
-            
-            # First check by primary identifier
+                primary_identifier = label_identifier
+            else:
+                primary_identifier = id_attr or name_attr or label_identifier
+
+            # Check if we've seen this field before, either directly or via the label alias
             if primary_identifier in seen:
-                existing_field = seen[primary_identifier]
                 existing_key = primary_identifier
-            # Then check by label identifier if different
-            elif label_identifier != primary_identifier and label_identifier in seen:
-                existing_field = seen[label_identifier]  
-                existing_key = label_identifier
-            
+            else:
+                existing_key = alias_to_canon.get(label_identifier)
+                if existing_key is not None and existing_key not in seen:
+                    existing_key = None
+            existing_field = seen[existing_key] if existing_key else None
+
             if existing_field:
                 # Keep the field with more information (dropdown with options > text field, etc.)
                 should_replace = False
@@ -2784,21 +2883,21 @@ class SimpleFormExtractor:
                         del seen[existing_key]
                     # Add new field with primary identifier
                     seen[primary_identifier] = field
+                    alias_to_canon[label_identifier] = primary_identifier
                     # Update in clean_fields list
                     for i, cf in enumerate(clean_fields):
                         if cf is existing_field:
                             clean_fields[i] = field
                             break
-                # If not replacing, we might need to update the seen dict key
+                # If not replacing, keep the existing field reachable under this key too
                 elif existing_key != primary_identifier:
-                    # Update the key but keep the existing field
-                    del seen[existing_key]
                     seen[primary_identifier] = existing_field
             else:
                 # New field
                 seen[primary_identifier] = field
+                alias_to_canon.setdefault(label_identifier, primary_identifier)
                 clean_fields.append(field)
-        
+
         return clean_fields
     
     def _normalize_label_for_deduplication(self, label: str) -> str:
@@ -2867,18 +2966,31 @@ class SimpleFormExtractor:
         
         return template
 
+    async def _snapshot(self, page: Page) -> BeautifulSoup:
+        """Fetch and parse the page DOM once, reusing the tree across helpers.
+
+        Keyed by the page object so company/title probes on the same page
+        share a single content() round-trip.
+        """
+        key = id(page)
+        tree = self._dom_snapshots.get(key)
+        if tree is None:
+            tree = BeautifulSoup(await page.content(), 'lxml')
+            self._dom_snapshots[key] = tree
+        return tree
+
     async def _extract_job_title(self, page: Page) -> str:
         """Extract job title from the page."""
         try:
-            # Try common selectors for job title
-            selectors = ['h1', '.job-title', '[data-testid="job-title"]', 'title']
-            
-            for selector in selectors:
-                elem = await page.query_selector(selector)
-                if elem:
-                    text = await elem.text_content()
-                    if text and text.strip() and len(text.strip()) < 200:
-                        return text.strip()
+            # Try common selectors for job title against the shared DOM
+            # snapshot - no per-selector browser round-trips
+            tree = await self._snapshot(page)
+            for selector in ('h1', '.job-title', '[data-testid="job-title"]', 'title'):
+                elem = tree.select_one(selector)
+                if elem is not None:
+                    text = elem.get_text(strip=True)
+                    if text and len(text) < 200:
+                        return text
             
             # Fallback: get from page title
             title = await page.title()
@@ -2896,54 +3008,105 @@ class SimpleFormExtractor:
 
     async def _extract_company(self, page: Page) -> str:
         """Extract company name from the page."""
+        # Serve repeat visits to the same host from the per-instance cache
+        try:
+            origin = urlparse(getattr(page, 'url', '') or '').netloc
+        except Exception:
+            origin = ''
+        if origin and origin in self._company_cache:
+            return self._company_cache[origin]
+
+        company = await self._probe_company(page)
+        if origin:
+            self._company_cache[origin] = company
+        return company
+
+    async def _probe_company(self, page: Page) -> str:
+        """Run the actual company-name probes against the page."""
         try:
             # Try from page title first
             title = await page.title()
             if ' at ' in title:
                 company = title.split(' at ')[-1]
                 return company.strip()
-            
-            # Try common selectors
-            selectors = ['.company-name', '[data-testid="company-name"]', 'img[alt*="Logo"]']
-            
-            for selector in selectors:
-                elem = await page.query_selector(selector)
-                if elem:
-                    if selector.startswith('img'):
-                        alt_text = await elem.get_attribute('alt')
-                        if alt_text and 'logo' in alt_text.lower():
-                            company = alt_text.replace('Logo', '').replace('logo', '').strip()
-                            if company:
-                                return company
-                    else:
-                        text = await elem.text_content()
-                        if text and text.strip():
-                            return text.strip()
-            
+
+            # Run the read-only probes against the shared DOM snapshot
+            tree = await self._snapshot(page)
+            for selector, is_img in self._company_probes:
+                el = tree.select_one(selector)
+                if el is None:
+                    continue
+                if is_img:
+                    alt = (el.get('alt') or '').strip()
+                    # A changed string doubles as the 'alt mentions logo' check
+                    company = _LOGO_RE.sub('', alt).strip()
+                    if company and company != alt:
+                        return company
+                else:
+                    text = el.get_text(strip=True)
+                    if text:
+                        return text
+
             return "Unknown Company"
-            
+
         except Exception:
             return "Unknown Company"
 
-    def _extract_domain_from_src(self, src: str) -> str:
-        """Extract a meaningful domain identifier from iframe src for selector."""
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _extract_domain_from_src(src: str) -> str:
+        """Extract a meaningful domain identifier from iframe src for selector.
+
+        Memoized because the same ATS srcs recur across pages and iframes.
+        """
         try:
-            if 'greenhouse' in src.lower():
-                return 'greenhouse'
-            elif 'workday' in src.lower():
-                return 'workday'
-            elif 'lever' in src.lower():
-                return 'lever'
-            else:
-                # Extract domain from URL
-                from urllib.parse import urlparse
-                parsed = urlparse(src)
-                domain = parsed.netloc.split('.')[0] if parsed.netloc else 'iframe'
-                return domain
+            src_lower = src.lower()
+            for marker, domain in _ATS_MARKERS:
+                if marker in src_lower:
+                    return domain
+            # Extract domain from URL
+            parsed = urlparse(src)
+            return parsed.netloc.partition('.')[0] or 'iframe'
         except Exception:
             return 'iframe'
 
 
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize one JSON value to bytes with the fastest available encoder."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_form_data(filename: str, form_data: Dict[str, Any]) -> None:
+    """Write form data as JSON, streaming the field arrays one record at a time.
+
+    Keeps peak memory at O(one field) instead of buffering the whole serialized
+    document, which matters for forms with hundreds of options per dropdown.
+    """
+    with open(filename, 'wb') as f:
+        f.write(b'{')
+        first = True
+        for key, value in form_data.items():
+            if not first:
+                f.write(b',\n')
+            first = False
+            f.write(json.dumps(key).encode('utf-8'))
+            f.write(b': ')
+
+            if key in ('fields', 'user_input_template') and isinstance(value, list):
+                # Stream the large arrays record-by-record
+                f.write(b'[')
+                for i, item in enumerate(value):
+                    if i:
+                        f.write(b',\n')
+                    f.write(_dumps_bytes(item))
+                f.write(b']')
+            else:
+                f.write(_dumps_bytes(value))
+        f.write(b'}\n')
+
+
 async def main():
     if len(sys.argv) not in [2, 3]:
         print("Usage: python simple_form_extractor.py <job_url> [config_file]")
@@ -2957,8 +3120,12 @@ async def main():
     if len(sys.argv) == 3:
         config_file = sys.argv[2]
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(config_file, 'rb') as f:
+                    config = orjson.loads(f.read())
+            else:
+                with open(config_file, 'r') as f:
+                    config = json.load(f)
             print(f"📋 Loaded configuration from {config_file}")
         except Exception as e:
             print(f"⚠️  Warning: Could not load config file {config_file}: {e}")
@@ -2969,21 +3136,22 @@ async def main():
     try:
         form_data = await extractor.extract_form_data(url)
         
-        # Create filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"simple_form_data_{timestamp}.json"
-        
-        # Save to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(form_data, f, indent=2, ensure_ascii=False)
+        # Create filename (monotonic ns timestamp avoids strftime and collisions)
+        filename = f"simple_form_data_{time.time_ns()}.json"
         
+        # Preview lines were built during extraction and stashed on the
+        # extractor, so they never appear in the serialized form data
+        preview = extractor.last_preview
+
+        # Save to file, streaming the field arrays to keep peak memory low.
+        # Run in a worker thread so disk I/O doesn't block the event loop.
+        await asyncio.to_thread(_write_form_data, filename, form_data)
+
         print(f"✅ Form data extracted and saved to {filename}")
         print(f"📊 Found {form_data['total_fields']} fields ({form_data['required_fields']} required)")
         print("\n🔍 Fields Preview:")
-        for i, field in enumerate(form_data['fields'][:5], 1):
-            req_indicator = " *" if field.get('required') else ""
-            options_info = f" ({len(field.get('options', []))} options)" if field.get('options') else ""
-            print(f"  {i}. {field['label']} ({field['type']}){req_indicator}{options_info}")
+        # Single buffered write instead of one syscall per field
+        sys.stdout.write('\n'.join(preview) + '\n')
         
         if len(form_data['fields']) > 5:
             print(f"  ... and {len(form_data['fields']) - 5} more fields")
@@ -4,25 +4,36 @@ Simple Form Filler - Automatically fills job application forms
 Takes JSON output from form extractor with user-filled values and submits the form
 """
 
+from __future__ import annotations
+
 import asyncio
+import atexit
+import contextlib
 import json
+import queue
+import re
 import sys
 import logging
 import os
+import time
 import warnings
-from typing import Dict, Any, List, Optional
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from pathlib import Path
-from playwright.async_api import async_playwright, Page, ElementHandle
-from undetected_playwright import stealth_async
 
-# Try to import geocoder, fallback if not available
+# playwright and geocoder are imported lazily at their call sites so that
+# importing this module (e.g. for type hints) stays fast
+if TYPE_CHECKING:
+    from playwright.async_api import Page, ElementHandle
+
+# Try to use orjson for fast JSON parsing, fall back to stdlib json
+# (both accept bytes, so callers always read files in binary mode)
 try:
-    import geocoder
-    GEOCODER_AVAILABLE = True
+    import orjson
+    _loads = orjson.loads
 except ImportError:
-    GEOCODER_AVAILABLE = False
-    print("⚠️ Warning: 'geocoder' library not found. Install with: pip install geocoder")
-    print("   Falling back to hardcoded San Francisco coordinates.")
+    _loads = json.loads
 
 # Suppress Windows asyncio pipe warnings
 warnings.filterwarnings("ignore", category=ResourceWarning, message=".*unclosed.*")
@@ -43,17 +54,187 @@ except (PermissionError, OSError):
     # Fallback to temporary directory
     log_file = Path(tempfile.gettempdir()) / 'job_automator_form_filler.log'
 
+# Route records through a queue so logger calls on the event loop just
+# enqueue; a background listener thread does the blocking file/console writes
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler(log_file, encoding='utf-8')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# Resource types aborted when block_resources is on; forms don't need them
+# and they dominate page-load time on image-heavy career sites. Stylesheets
+# stay enabled so the visible browser remains reviewable by the user.
+_BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media'}
+
+# IP-geolocation endpoints, hoisted so the lookup path allocates no URL
+# strings per call; ip-api.com doubles as the stdlib-fallback endpoint
+_IP_API_URL = 'http://ip-api.com/json/'
+_IP_LOOKUP_URLS = (
+    _IP_API_URL,
+    'https://ipapi.co/json/',
+    'https://ipinfo.io/json',
+)
+
+# San Francisco coordinates returned when every location lookup fails —
+# one shared read-only mapping instead of a fresh dict per call
+_FALLBACK_COORDS = MappingProxyType({
+    'latitude': 37.7749,
+    'longitude': -122.4194,
+    'accuracy': 0
+})
+
+# Compiled once: matches text identifying a 'Locate me' style button
+_LOCATE_KW_RE = re.compile(r'locate|location|gps|detect|current', re.IGNORECASE)
+
+# Comprehensive selectors for any "Locate me" button on the page, used by
+# the direct Playwright scan (supports :has-text) when no tagged buttons
+# are found
+_GENERAL_LOCATE_SELECTORS = [
+    # Text-based - most common patterns
+    'button:has-text("Locate me")',
+    'button:has-text("Use my location")',
+    'button:has-text("Current location")',
+    'button:has-text("Detect location")',
+    'button:has-text("Auto-detect")',
+    'a:has-text("Locate me")',
+    'a:has-text("Use my location")',
+    'span:has-text("Locate me")',
+
+    # Class/ID patterns
+    '.locate-me',
+    '.location-btn',
+    '.geo-locate',
+    '.use-location',
+    '.detect-location',
+    '.auto-location',
+    '#locate-me',
+    '#location-btn',
+
+    # Data attributes
+    '[data-testid*="locate"]',
+    '[data-testid*="location"]',
+    '[data-qa*="locate"]',
+    '[data-qa*="location"]',
+
+    # ARIA labels
+    '[aria-label*="locate"]',
+    '[aria-label*="location"]',
+    '[aria-label*="detect location"]',
+
+    # Title attributes
+    '[title*="locate"]',
+    '[title*="location"]',
+    '[title*="gps"]',
+
+    # Icon-based (GPS symbols)
+    'button[class*="gps"]',
+    'button[class*="location"]'
+]
+
+# Pure-CSS selectors hit Playwright's native querySelectorAll fast path;
+# mixing in :has-text forces the slower text engine for the whole query.
+# The CSS pass runs first and the text-engine pass only when it misses.
+_LOCATE_CSS_SELECTOR = ', '.join(
+    s for s in _GENERAL_LOCATE_SELECTORS if 'has-text' not in s)
+_LOCATE_TEXT_SELECTOR = ', '.join(
+    s for s in _GENERAL_LOCATE_SELECTORS if 'has-text' in s)
+
+# Browser-side observer that tags locate-style buttons with data-locate="1"
+# as they render. :has-text is a Playwright extension the native
+# querySelectorAll doesn't know, so the text patterns are matched against
+# textContent instead; the later scan then reads one attribute selector
+# rather than re-running the full selector list against whatever state the
+# SPA happens to be in.
+_LOCATE_OBSERVER_JS = """
+(() => {
+    const CSS_SEL = '%s';
+    const TEXT_RE = /locate me|use my location|current location|detect location|auto-detect/i;
+    let scheduled = false;
+    const mark = () => {
+        scheduled = false;
+        document.querySelectorAll(CSS_SEL).forEach(el => el.dataset.locate = '1');
+        document.querySelectorAll('button, a, span').forEach(el => {
+            if (TEXT_RE.test(el.textContent || '')) el.dataset.locate = '1';
+        });
+    };
+    const schedule = () => {
+        if (!scheduled) { scheduled = true; setTimeout(mark, 100); }
+    };
+    new MutationObserver(schedule).observe(document.documentElement, { childList: true, subtree: true });
+    document.addEventListener('DOMContentLoaded', mark);
+})();
+""" % _LOCATE_CSS_SELECTOR
+
+# Automation-fingerprint patches injected once per context via
+# add_init_script, replacing the per-page stealth_async() evaluate calls.
+# One CDP call covers every page and iframe the context opens.
+_STEALTH_JS = """
+(() => {
+    Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+    window.chrome = window.chrome || { runtime: {} };
+    Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+    Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
+    const getParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function (parameter) {
+        if (parameter === 37445) return 'Intel Inc.';
+        if (parameter === 37446) return 'Intel Iris OpenGL Engine';
+        return getParameter.call(this, parameter);
+    };
+    const originalQuery = window.navigator.permissions.query.bind(window.navigator.permissions);
+    window.navigator.permissions.query = (parameters) =>
+        parameters.name === 'notifications'
+            ? Promise.resolve({ state: Notification.permission })
+            : originalQuery(parameters);
+})();
+"""
+
+# Shared Playwright driver: starting the node driver subprocess costs
+# hundreds of ms, so initialize it lazily once and reuse it across
+# fill_form calls in the same process
+_playwright_singleton = None
+
+async def _get_playwright():
+    """Return the shared Playwright instance, starting it on first use."""
+    global _playwright_singleton
+    if _playwright_singleton is None:
+        from playwright.async_api import async_playwright
+        _playwright_singleton = await async_playwright().start()
+    return _playwright_singleton
+
+async def _shutdown_playwright():
+    """Stop the shared Playwright driver (call once at process exit)."""
+    global _playwright_singleton
+    if _playwright_singleton is not None:
+        try:
+            await _playwright_singleton.stop()
+        except Exception as e:
+            logger.debug(f"Error stopping Playwright driver: {e}")
+        finally:
+            _playwright_singleton = None
+
 class SimpleFormFiller:
+    # Process-wide location cache so repeated fill_form calls skip the
+    # IP-geolocation lookup (and the disk cache read) entirely
+    _location_cache: Optional[Dict[str, Any]] = None
+
+    # In-flight location lookup shared by concurrent callers (single-flight)
+    _location_future: Optional[asyncio.Future] = None
+
+    # Browsers kept warm across fill_form calls, keyed by launch args —
+    # chromium cold-start is ~1s while new_context() is ~20ms
+    _browser_cache: Dict[tuple, Any] = {}
+
     def __init__(self):
         self.logger = logger
         self.page = None
@@ -61,6 +242,12 @@ class SimpleFormFiller:
         self.browser = None
         self.form_data = None  # Store form data for helper methods
         self.iframe_frame = None  # Store iframe frame context when needed
+        self._context = None  # Memoized form context (page or iframe frame)
+        self._field_label_by_id = {}  # Precomputed id -> question lookup
+        self.verify_fills = False  # Re-read values after fill() (extra round-trip per field)
+        self._locator_cache = {}  # field_id -> resolved locator, per fill run
+        self._resolved_selectors = {}  # field_id -> selector, pre-resolved in-page
+        self.block_resources = True  # Abort image/font/media requests; disable for problem sites
         
         # Timeouts and wait strategies
         self.timeouts = {
@@ -77,23 +264,42 @@ class SimpleFormFiller:
             'enabled': True,
             'default_coordinates': None,  # Will be set by _get_real_location()
             'timeout': 5000,  # 5 seconds timeout for locate me operations
-            'location_keywords': ['location', 'city', 'state', 'country', 'address', 'zip', 'postal']
+            'location_keywords': ['location', 'city', 'state', 'country', 'address', 'zip', 'postal'],
+            'cache_ttl': 7 * 24 * 3600  # Re-detect coordinates at most weekly
         }
+
+        # One compiled case-insensitive scan replaces the per-call keyword
+        # loop (and the double lowercasing) in _is_location_field
+        self._location_kw_re = re.compile(
+            '|'.join(re.escape(k) for k in self.geolocation_config['location_keywords']),
+            re.IGNORECASE)
     
     async def fill_form(self, json_file_path: str) -> bool:
-        """Main method to fill form based on JSON data."""
+        """Main method to fill form based on a JSON data file."""
+        form_data = self._load_form_data(json_file_path)
+        if not form_data:
+            return False
+        return await self.fill_form_data(form_data)
+
+    async def fill_form_data(self, form_data: Dict[str, Any]) -> bool:
+        """Fill a form from an already-loaded data dict.
+
+        In-process callers (like the MCP server) use this directly so the
+        data never takes a serialize-to-disk round trip.
+        """
         try:
             # Reset iframe frame for new session
             self.iframe_frame = None
-            
+            self._context = None
+
             # Get real location coordinates before browser initialization
-            self.geolocation_config['default_coordinates'] = self._get_real_location()
-            
-            # Load and validate JSON data
-            self.form_data = self._load_form_data(json_file_path)
+            self.geolocation_config['default_coordinates'] = await self._get_real_location_cached()
+
+            # Validate the data and build the field-label index
+            self.form_data = self._prepare_form_data(form_data)
             if not self.form_data:
                 return False
-            
+
             # Initialize browser
             await self._initialize_browser()
             
@@ -129,58 +335,67 @@ class SimpleFormFiller:
             await self._cleanup_browser()
     
     def _load_form_data(self, json_file_path: str) -> Optional[Dict[str, Any]]:
-        """Load and validate form data from JSON file."""
+        """Load form data from a JSON file."""
         try:
-            if not os.path.exists(json_file_path):
-                self.logger.error(f"JSON file not found: {json_file_path}")
-                return None
-            
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Validate required fields
-            required_keys = ['url', 'form_context', 'user_input_template']
-            for key in required_keys:
-                if key not in data:
-                    self.logger.error(f"Missing required key in JSON: {key}")
-                    return None
-            
-            self.logger.info(f"Loaded form data for: {data.get('job_title', 'Unknown Job')}")
-            self.logger.info(f"Company: {data.get('company', 'Unknown Company')}")
-            self.logger.info(f"Total fields to fill: {len(data['user_input_template'])}")
-            
-            return data
-            
-        except json.JSONDecodeError as e:
+            # EAFP: opening directly skips the extra stat() of an exists
+            # check and avoids the race between check and open; bytes mode
+            # lets the JSON parser handle the UTF-8 decode itself
+            with open(json_file_path, 'rb') as f:
+                return _loads(f.read())
+
+        except FileNotFoundError:
+            self.logger.error(f"JSON file not found: {json_file_path}")
+            return None
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
             self.logger.error(f"Invalid JSON format: {e}")
             return None
         except Exception as e:
             self.logger.error(f"Error loading JSON data: {e}")
             return None
-    
+
+    def _prepare_form_data(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Validate form data and build the id -> label index."""
+        # Validate required fields
+        required_keys = ['url', 'form_context', 'user_input_template']
+        for key in required_keys:
+            if key not in data:
+                self.logger.error(f"Missing required key in JSON: {key}")
+                return None
+
+        # Precompute id -> label once so the fill path does O(1) lookups
+        # instead of scanning the template per field
+        self._field_label_by_id = {
+            field.get('id'): (field.get('question') or field.get('label') or '').strip()
+            for field in data['user_input_template']
+        }
+
+        self.logger.info(f"Loaded form data for: {data.get('job_title', 'Unknown Job')}")
+        self.logger.info(f"Company: {data.get('company', 'Unknown Company')}")
+        self.logger.info(f"Total fields to fill: {len(data['user_input_template'])}")
+
+        return data
+
     async def _initialize_browser(self):
         """Initialize browser with stealth mode."""
         self.logger.info("Initializing browser...")
-        
-        playwright = await async_playwright().__aenter__()
-        
-        # Launch browser in non-headless mode for user interaction
-        self.browser = await playwright.chromium.launch(
-            headless=False,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--disable-extensions',
-                '--disable-plugins',
-                '--aggressive-cache-discard',
-                '--memory-pressure-off'
-            ]
-        )
-        
+
+        playwright = await _get_playwright()
+
+        # Launch (or reuse) browser in non-headless mode for user interaction
+        self.browser = await self._ensure_browser(playwright, (
+            '--disable-blink-features=AutomationControlled',
+            '--disable-dev-shm-usage',
+            '--no-sandbox',
+            '--disable-setuid-sandbox',
+            '--disable-web-security',
+            '--disable-features=VizDisplayCompositor',
+            '--disable-extensions',
+            '--disable-plugins',
+            '--aggressive-cache-discard',
+            '--memory-pressure-off'
+        ))
+
         # Create context with realistic settings and geolocation permissions
         self.context = await self.browser.new_context(
             viewport={'width': 1280, 'height': 900},
@@ -189,19 +404,54 @@ class SimpleFormFiller:
                 'Accept-Language': 'en-US,en;q=0.9'
             },
             # Grant geolocation permissions and set default coordinates
-            geolocation=self.geolocation_config['default_coordinates'],
+            # dict() so the frozen fallback mapping serializes like any other
+            geolocation=dict(self.geolocation_config['default_coordinates']),
             permissions=['geolocation']
         )
         
+        # Abort requests for resources forms don't need - typically the
+        # single largest navigation-time win on image-heavy pages
+        if self.block_resources:
+            async def _block_heavy_resources(route):
+                if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await self.context.route('**/*', _block_heavy_resources)
+
+        # Apply stealth patches once for the whole context (pages + iframes)
+        await self.context.add_init_script(_STEALTH_JS)
+
+        # Tag locate buttons as SPAs render them, so the geolocation pass
+        # reads one attribute selector instead of a 30-selector scan
+        await self.context.add_init_script(_LOCATE_OBSERVER_JS)
+
         self.page = await self.context.new_page()
-        
-        # Apply stealth mode
-        await stealth_async(self.page)
-        
+
+        # Drop the memoized form context whenever a frame navigates so the
+        # next helper re-resolves it
+        self.page.on('framenavigated', lambda _frame: setattr(self, '_context', None))
+
         self.logger.info("Browser initialized successfully")
         self.logger.info(f"🌍 Geolocation enabled with coordinates: {self.geolocation_config['default_coordinates']['latitude']}, {self.geolocation_config['default_coordinates']['longitude']}")
         self.logger.info("📍 'Locate me' buttons will be clicked AFTER all form fields are filled")
     
+    async def _ensure_browser(self, playwright, launch_args: tuple):
+        """Return a warm browser for these launch args, launching on miss.
+
+        Each fill_form run gets a fresh BrowserContext but shares the
+        underlying chromium process, skipping its cold start on repeat runs.
+        """
+        browser = SimpleFormFiller._browser_cache.get(launch_args)
+        if browser and browser.is_connected():
+            self.logger.info("Reusing warm browser instance")
+            return browser
+
+        browser = await playwright.chromium.launch(headless=False, args=list(launch_args))
+        SimpleFormFiller._browser_cache[launch_args] = browser
+        return browser
+
     async def _navigate_to_form(self, form_data: Dict[str, Any]) -> Optional[Page]:
         """Navigate to the form page, handling iframes if needed."""
         try:
@@ -210,15 +460,21 @@ class SimpleFormFiller:
             
             self.logger.info(f"Navigating to: {url}")
             
-            # Navigate to the URL
-            response = await self.page.goto(url, timeout=self.timeouts['navigation'])
+            # Navigate to the URL; 'commit' returns as soon as the response
+            # starts instead of waiting for every subresource to load
+            response = await self.page.goto(url, wait_until='commit', timeout=self.timeouts['navigation'])
             if response:
                 self.logger.info(f"Navigation response: {response.status}")
-            
-            # Wait for page to load
-            await self.page.wait_for_load_state('domcontentloaded')
-            await self._smart_wait(500)
-            
+
+            # Wait precisely for the form (or its iframe) to attach rather
+            # than the full load event
+            try:
+                await self.page.locator('form, iframe, [role="form"]').first.wait_for(
+                    state='attached', timeout=5000)
+            except Exception:
+                # No form element appeared; fall back to the classic barrier
+                await self.page.wait_for_load_state('domcontentloaded')
+
             # Dismiss any overlays/cookie banners
             await self._dismiss_overlays()
             
@@ -249,106 +505,52 @@ class SimpleFormFiller:
                 return None
             
             self.logger.info(f"Looking for iframe with src: {iframe_src}")
-            
+
             # Wait for iframe to be present on the page
             await self._smart_wait(1000)  # Extra wait for iframe to load
-            
-            # Try to find the iframe element using different strategies
-            iframe_element = None
-            
-            # Strategy 1: Find by exact src match
-            try:
-                iframe_element = await self.page.wait_for_selector(f'iframe[src="{iframe_src}"]', timeout=5000)
-                if iframe_element:
-                    self.logger.info("Found iframe by exact src match")
-            except:
-                pass
-            
-            # Strategy 2: Find by partial src match (in case of relative URLs)
-            if not iframe_element:
-                try:
-                    iframes = await self.page.query_selector_all('iframe')
-                    for iframe in iframes:
-                        src = await iframe.get_attribute('src')
-                        if src and (iframe_src in src or src in iframe_src):
-                            iframe_element = iframe
-                            self.logger.info("Found iframe by partial src match")
-                            break
-                except:
-                    pass
-            
-            # Strategy 3: Find first iframe if only one exists
-            if not iframe_element:
-                try:
-                    iframes = await self.page.query_selector_all('iframe')
-                    if len(iframes) == 1:
-                        iframe_element = iframes[0]
-                        self.logger.info("Using single iframe found on page")
-                except:
-                    pass
-            
-            # Strategy 4: If iframe not found, navigate directly to iframe src URL
-            if not iframe_element:
-                self.logger.warning("Could not find iframe element on the page")
+
+            # page.frames is a synchronous list, so matching on frame.url in
+            # Python costs zero round-trips and no per-strategy timeouts
+            frame = None
+            child_frames = [f for f in self.page.frames if f is not self.page.main_frame]
+
+            for candidate in child_frames:
+                url = candidate.url or ''
+                if url and (iframe_src in url or url in iframe_src):
+                    frame = candidate
+                    self.logger.info("Found iframe frame by src match")
+                    break
+
+            # Fallback: use the only child frame if there is exactly one
+            if not frame and len(child_frames) == 1:
+                frame = child_frames[0]
+                self.logger.info("Using single iframe found on page")
+
+            # Fallback: iframe not found, navigate directly to iframe src URL
+            if not frame:
+                self.logger.warning("Could not find iframe frame on the page")
                 self.logger.info(f"🔄 Attempting fallback: navigating directly to iframe src URL: {iframe_src}")
-                
-                try:
-                    # Check if iframe_src is a relative URL and make it absolute if needed
-                    if iframe_src.startswith('/'):
-                        from urllib.parse import urljoin
-                        current_url = self.page.url
-                        iframe_src = urljoin(current_url, iframe_src)
-                        self.logger.info(f"Converted relative URL to absolute: {iframe_src}")
-                    
-                    # Navigate directly to the iframe URL
-                    response = await self.page.goto(iframe_src, timeout=self.timeouts['navigation'])
-                    if response:
-                        self.logger.info(f"Direct navigation response: {response.status}")
-                    
-                    # Wait for page to load
-                    await self.page.wait_for_load_state('domcontentloaded')
-                    await self._smart_wait(1000)
-                    
-                    # Dismiss any overlays on the new page
-                    await self._dismiss_overlays()
-                    
-                    # Reset iframe_frame since we're now on the main page (not iframe)
-                    self.iframe_frame = None
-                    
-                    self.logger.info("✅ Successfully navigated directly to iframe src URL")
-                    self.logger.info("📋 Form filling will continue on the main page")
-                    return self.page
-                    
-                except Exception as nav_error:
-                    self.logger.error(f"Failed to navigate directly to iframe src URL: {nav_error}")
-                    return None
-            
-            # Original iframe access logic (when iframe is found)
+                return await self._navigate_to_iframe_src_directly(iframe_src)
+
+            # Frame access logic (when iframe frame is found)
             try:
-                # Get the iframe's frame context
-                frame = await iframe_element.content_frame()
-                if not frame:
-                    self.logger.error("Could not access iframe content frame")
-                    # Fallback to direct navigation if frame access fails
-                    self.logger.info(f"🔄 Frame access failed, attempting direct navigation to: {iframe_src}")
-                    return await self._navigate_to_iframe_src_directly(iframe_src)
-                
                 # Wait for iframe content to load
                 await frame.wait_for_load_state('domcontentloaded')
                 await self._smart_wait(1000)  # Extra wait for form content to load
-                
+
                 # Store the frame for use in form filling
                 self.iframe_frame = frame
-                
+                self._context = None
+
                 self.logger.info("✅ Successfully accessed iframe content frame")
                 return self.page  # Return page but we'll use iframe_frame for form operations
-                
+
             except Exception as frame_error:
                 self.logger.error(f"Error accessing iframe frame: {frame_error}")
                 # Fallback to direct navigation if frame access fails
                 self.logger.info(f"🔄 Frame access failed, attempting direct navigation to: {iframe_src}")
                 return await self._navigate_to_iframe_src_directly(iframe_src)
-                
+
         except Exception as e:
             self.logger.error(f"Error in iframe navigation: {e}")
             return None
@@ -363,20 +565,24 @@ class SimpleFormFiller:
                 iframe_src = urljoin(current_url, iframe_src)
                 self.logger.info(f"Converted relative URL to absolute: {iframe_src}")
             
-            # Navigate directly to the iframe URL
-            response = await self.page.goto(iframe_src, timeout=self.timeouts['navigation'])
+            # Navigate directly to the iframe URL; wait for the form to
+            # attach instead of the full load event plus a fixed sleep
+            response = await self.page.goto(iframe_src, wait_until='commit', timeout=self.timeouts['navigation'])
             if response:
                 self.logger.info(f"Direct navigation response: {response.status}")
-            
-            # Wait for page to load
-            await self.page.wait_for_load_state('domcontentloaded')
-            await self._smart_wait(1000)
+
+            try:
+                await self.page.locator('form, [role="form"]').first.wait_for(
+                    state='attached', timeout=5000)
+            except Exception:
+                await self.page.wait_for_load_state('domcontentloaded')
             
             # Dismiss any overlays on the new page
             await self._dismiss_overlays()
             
             # Reset iframe_frame since we're now on the main page (not iframe)
             self.iframe_frame = None
+            self._context = None
             
             self.logger.info("✅ Successfully navigated directly to iframe src URL")
             self.logger.info("📋 Form filling will continue on the main page")
@@ -387,8 +593,47 @@ class SimpleFormFiller:
             return None
     
     def _get_form_context(self):
-        """Get the appropriate context for form operations (page or iframe frame)."""
-        return self.iframe_frame if self.iframe_frame else self.page
+        """Get the appropriate context for form operations (page or iframe frame).
+
+        Memoized so the fill hot path reads a cached attribute; invalidated
+        whenever iframe_frame or page changes.
+        """
+        if self._context is None:
+            self._context = self.iframe_frame if self.iframe_frame else self.page
+        return self._context
+
+    async def _first_matching_locator(self, context, selectors: List[str],
+                                      cache_key: Optional[str] = None):
+        """Race all fallback selectors in a single wait.
+
+        Composes the selectors with locator.or_ so Playwright waits for
+        whichever matches first, instead of paying up to element_wait
+        per selector serially. When cache_key is given the resolved locator
+        is kept for the rest of the fill run, so retries skip the wait.
+        Locators are lazy, so caching them can't go stale like an
+        ElementHandle would. Returns the matched locator or None.
+        """
+        if cache_key is not None:
+            cached = self._locator_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            # Pre-resolved in one in-page pass at the start of the fill run
+            resolved = self._resolved_selectors.get(cache_key)
+            if resolved:
+                element = context.locator(resolved).first
+                self._locator_cache[cache_key] = element
+                return element
+        try:
+            loc = context.locator(selectors[0])
+            for selector in selectors[1:]:
+                loc = loc.or_(context.locator(selector))
+            element = loc.first
+            await element.wait_for(state='visible', timeout=self.timeouts['element_wait'])
+            if cache_key is not None:
+                self._locator_cache[cache_key] = element
+            return element
+        except Exception:
+            return None
     
     async def _fill_all_fields(self, page: Page, form_data: Dict[str, Any]) -> bool:
         """Fill all fields based on user input template."""
@@ -398,49 +643,245 @@ class SimpleFormFiller:
             total_count = len(user_inputs)
             
             self.logger.info(f"Starting to fill {total_count} fields...")
-            
-            for i, field_data in enumerate(user_inputs, 1):
+
+            # Fresh locator cache for this run
+            self._locator_cache = {}
+
+            # Resolve every field's fallback selector in one in-page pass so
+            # the per-field paths skip the selector race on a hit
+            self._resolved_selectors = await self._resolve_field_selectors(user_inputs)
+
+            # Fast path: set all simple text-like values in one in-page pass;
+            # anything that doesn't verify falls back to the per-field path
+            text_types = ('text', 'email', 'url', 'phone')
+            batch_filled = await self._batch_fill_text_fields(
+                [f for f in user_inputs if f.get('type') in text_types and f.get('value', '').strip()]
+            )
+
+            # Partition the remaining fields: text-like fields are independent
+            # and can run concurrently; dropdowns and file uploads open
+            # popovers/choosers so they stay sequential
+            parallel_types = text_types + ('textarea',)
+            parallel_group = []
+            serial_group = []
+
+            for field_data in user_inputs:
+                field_id = field_data['id']
+                field_value = field_data.get('value', '').strip()
+                field_question = field_data['question']
+
+                # Skip empty non-required fields
+                if not field_value and not field_data.get('required', False):
+                    self.logger.info(f"Skipping empty optional field: {field_id}")
+                    continue
+
+                # Skip empty required fields but warn
+                if not field_value and field_data.get('required', False):
+                    self.logger.warning(f"Required field is empty: {field_id}")
+                    continue
+
+                # Already handled by the batched text pass
+                if field_id in batch_filled:
+                    filled_count += 1
+                    self.logger.info(f"✅ Successfully filled: {field_question}")
+                    continue
+
+                if field_data.get('type') in parallel_types:
+                    parallel_group.append(field_data)
+                else:
+                    serial_group.append(field_data)
+
+            # Fill independent fields concurrently, capped so the protocol
+            # channel isn't flooded
+            if parallel_group:
+                semaphore = asyncio.Semaphore(6)
+
+                async def fill_limited(field_data):
+                    async with semaphore:
+                        return await self._fill_field_by_type(page, field_data)
+
+                results = await asyncio.gather(
+                    *(fill_limited(f) for f in parallel_group), return_exceptions=True)
+
+                for field_data, result in zip(parallel_group, results):
+                    if isinstance(result, Exception):
+                        self.logger.error(f"Error filling field {field_data['id']}: {result}")
+                    elif result:
+                        filled_count += 1
+                        self.logger.info(f"✅ Successfully filled: {field_data['question']}")
+                    else:
+                        self.logger.warning(f"❌ Failed to fill: {field_data['question']}")
+
+            # One read-back evaluate verifies every text-like fill; only
+            # mismatches pay the per-field retry cost
+            mismatches = await self._verify_text_fields(
+                [f for f in user_inputs
+                 if f.get('type') in parallel_types and f.get('value', '').strip()])
+            for field_data in mismatches:
+                self.logger.warning(f"Value mismatch, retrying: {field_data['question']}")
                 try:
-                    field_id = field_data['id']
-                    field_value = field_data.get('value', '').strip()
-                    field_type = field_data['type']
-                    field_question = field_data['question']
-                    
-                    self.logger.info(f"[{i}/{total_count}] Filling: {field_question}")
-                    
-                    # Skip empty non-required fields
-                    if not field_value and not field_data.get('required', False):
-                        self.logger.info(f"Skipping empty optional field: {field_id}")
-                        continue
-                    
-                    # Skip empty required fields but warn
-                    if not field_value and field_data.get('required', False):
-                        self.logger.warning(f"Required field is empty: {field_id}")
-                        continue
-                    
-                    # Fill field based on type
+                    await self._fill_field_by_type(page, field_data)
+                except Exception as e:
+                    self.logger.error(f"Retry failed for {field_data['id']}: {e}")
+
+            # Dropdowns and file uploads run one at a time as before
+            for field_data in serial_group:
+                try:
+                    self.logger.info(f"Filling: {field_data['question']}")
                     success = await self._fill_field_by_type(page, field_data)
-                    
+
                     if success:
                         filled_count += 1
-                        self.logger.info(f"✅ Successfully filled: {field_question}")
+                        self.logger.info(f"✅ Successfully filled: {field_data['question']}")
                     else:
-                        self.logger.warning(f"❌ Failed to fill: {field_question}")
-                    
-                    # Small delay between fields
-                    await self._smart_wait(100)
-                    
+                        self.logger.warning(f"❌ Failed to fill: {field_data['question']}")
+
                 except Exception as e:
                     self.logger.error(f"Error filling field {field_data.get('id', 'unknown')}: {e}")
                     continue
-            
+
             self.logger.info(f"Form filling completed: {filled_count}/{total_count} fields filled")
+            self._locator_cache = {}
             return filled_count > 0
             
         except Exception as e:
             self.logger.error(f"Error in fill_all_fields: {e}")
             return False
     
+    async def _resolve_field_selectors(self, user_inputs: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Resolve which fallback selector matches each field in one evaluate.
+
+        Instead of each field probing its selector ladder against the browser,
+        a single in-page loop tries every field's candidates and returns a
+        {field_id: selector} map. Fields missing from the map go through the
+        normal composite-locator race.
+        """
+        context = self._get_form_context()
+        probes = []
+        for field in user_inputs:
+            field_id = field.get('id')
+            if not field_id:
+                continue
+            probes.append({'id': field_id, 'sels': [
+                f'#{field_id}',
+                f'input[name="{field_id}"]',
+                f'select[name="{field_id}"]',
+                f'textarea[name="{field_id}"]',
+                f'[data-qa="{field_id}"]',
+                f'[data-testid="{field_id}"]'
+            ]})
+
+        if not probes:
+            return {}
+
+        try:
+            resolved = await context.evaluate('''(items) => {
+                const out = {};
+                for (const it of items) {
+                    for (const s of it.sels) {
+                        let el = null;
+                        try { el = document.querySelector(s); } catch (e) {}
+                        if (el) { out[it.id] = s; break; }
+                    }
+                }
+                return out;
+            }''', probes)
+            if resolved:
+                self.logger.info(f"⚡ Pre-resolved selectors for {len(resolved)}/{len(probes)} fields")
+            return resolved or {}
+        except Exception as e:
+            self.logger.debug(f"Selector pre-resolution failed: {e}")
+            return {}
+
+    async def _batch_fill_text_fields(self, fields: List[Dict[str, Any]]) -> set:
+        """Fill simple text-like fields with a single in-page evaluate.
+
+        The per-field path costs ~6 protocol round-trips per field (wait,
+        scroll, click, clear, fill, verify); this sets every value and fires
+        input/change events in one browser call, using the native value
+        setter so React-style controlled inputs pick up the change. Returns
+        the set of field ids whose values verified in-page; anything else
+        goes through the normal per-field fallback.
+        """
+        if not fields:
+            return set()
+
+        context = self._get_form_context()
+        payload = [
+            {
+                'id': f['id'],
+                'value': f['value'].strip(),
+                'selector_hints': [
+                    f'input[name="{f["id"]}"]',
+                    f'[data-qa="{f["id"]}"]',
+                    f'[data-testid="{f["id"]}"]'
+                ]
+            }
+            for f in fields
+        ]
+
+        try:
+            filled = await context.evaluate('''(items) => {
+                const done = [];
+                for (const it of items) {
+                    let el = document.getElementById(it.id);
+                    if (!el) {
+                        for (const sel of it.selector_hints) {
+                            el = document.querySelector(sel);
+                            if (el) break;
+                        }
+                    }
+                    if (!el) continue;
+                    const proto = el.tagName === 'TEXTAREA'
+                        ? window.HTMLTextAreaElement.prototype
+                        : window.HTMLInputElement.prototype;
+                    const setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+                    setter.call(el, it.value);
+                    el.dispatchEvent(new Event('input', {bubbles: true}));
+                    el.dispatchEvent(new Event('change', {bubbles: true}));
+                    if (el.value === it.value) done.push(it.id);
+                }
+                return done;
+            }''', payload)
+
+            if filled:
+                self.logger.info(f"⚡ Batch-filled {len(filled)}/{len(fields)} text fields in one pass")
+            return set(filled)
+
+        except Exception as e:
+            self.logger.debug(f"Batch text fill failed, using per-field path: {e}")
+            return set()
+
+    async def _verify_text_fields(self, fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Verify all text-like values with one read-back evaluate.
+
+        Returns the subset of fields whose in-page value doesn't match, so
+        the caller retries only those instead of reading back every field.
+        """
+        if not fields:
+            return []
+
+        context = self._get_form_context()
+        payload = [{'id': f['id'], 'value': f['value'].strip()} for f in fields]
+
+        try:
+            mismatched_ids = await context.evaluate('''(items) => {
+                const bad = [];
+                for (const it of items) {
+                    let el = document.getElementById(it.id);
+                    if (!el) {
+                        try { el = document.querySelector(`[name="${it.id}"]`); } catch (e) {}
+                    }
+                    if (!el || (el.value ?? '') !== it.value) bad.push(it.id);
+                }
+                return bad;
+            }''', payload)
+            bad = set(mismatched_ids)
+            return [f for f in fields if f['id'] in bad]
+        except Exception as e:
+            self.logger.debug(f"Batched verification failed: {e}")
+            return []
+
     async def _fill_field_by_type(self, page: Page, field_data: Dict[str, Any]) -> bool:
         """Fill a single field based on its type."""
         field_id = field_data['id']
@@ -489,7 +930,7 @@ class SimpleFormFiller:
                 except Exception as e:
                     self.logger.debug(f"Method 1 failed for {field_id}: {e}")
             
-            # Method 2: Try multiple selectors for finding the field (fallback)
+            # Method 2: Race all fallback selectors in one wait (fallback)
             selectors = [
                 f'#{field_id}',
                 f'input[id="{field_id}"]',
@@ -497,29 +938,27 @@ class SimpleFormFiller:
                 f'[data-qa="{field_id}"]',
                 f'[data-testid="{field_id}"]'
             ]
-            
-            for selector in selectors:
-                try:
-                    element = await context.wait_for_selector(selector, timeout=5000)
-                    if element:
-                        break
-                except:
-                    continue
-            
+
+            element = await self._first_matching_locator(context, selectors, cache_key=field_id)
+
             if not element:
                 self.logger.error(f"Could not find text field: {field_id}")
                 return False
             
-            # Scroll to element and ensure it's visible
-            await element.scroll_into_view_if_needed()
-            await self._smart_wait(100)
-            
-            # Clear existing value and fill new value
-            await element.click()
-            await element.fill('')  # Clear first
-            await element.fill(value)
-            
-            # Verify the value was set
+            # fill() auto-waits for actionability and auto-scrolls, so no
+            # explicit scroll/click round-trips; if an overlay intercepts it,
+            # fall back to the explicit path once
+            try:
+                await element.fill(value)
+            except Exception:
+                await element.scroll_into_view_if_needed()
+                await element.click()
+                await element.fill(value)
+
+            if not self.verify_fills:
+                return True
+
+            # Verify the value was set (optional extra round-trip)
             actual_value = await element.input_value()
             if actual_value == value:
                 return True
@@ -549,23 +988,26 @@ class SimpleFormFiller:
                     if element:
                         # Click to open the dropdown
                         await element.scroll_into_view_if_needed()
-                        await self._smart_wait(100)
-                        
-                        # Click the toggle button to open dropdown
+
+                        # Click the toggle button to open dropdown, then wait for
+                        # the options to actually appear instead of sleeping;
+                        # no_wait_after since we await option visibility ourselves
                         toggle_button = context.locator('button:has-text("Toggle flyout")').first
                         try:
-                            await toggle_button.click()
-                            await self._smart_wait(300)
+                            await toggle_button.click(no_wait_after=True)
                         except:
                             # Fallback: click the combobox itself
-                            await element.click()
-                            await self._smart_wait(300)
-                        
+                            await element.click(no_wait_after=True)
+                        try:
+                            await context.locator('[role="option"]').first.wait_for(
+                                state='visible', timeout=self.timeouts['dropdown_load'])
+                        except Exception:
+                            pass
+
                         # Look for the option by exact text match
                         try:
                             option = context.get_by_role('option', name=value, exact=True)
                             await option.click()
-                            await self._smart_wait(200)
                             return True
                         except Exception as e:
                             self.logger.debug(f"Exact option match failed for '{value}': {e}")
@@ -573,7 +1015,6 @@ class SimpleFormFiller:
                             try:
                                 option = context.get_by_role('option').filter(has_text=value).first
                                 await option.click()
-                                await self._smart_wait(200)
                                 return True
                             except:
                                 pass
@@ -581,7 +1022,7 @@ class SimpleFormFiller:
                 except Exception as e:
                     self.logger.debug(f"Method 1 failed for {field_id}: {e}")
             
-            # Method 2: Try multiple selectors for dropdown (fallback)
+            # Method 2: Race all fallback dropdown selectors in one wait (fallback)
             selectors = [
                 f'#{field_id}',
                 f'select[id="{field_id}"]',
@@ -589,27 +1030,19 @@ class SimpleFormFiller:
                 f'[role="combobox"][id="{field_id}"]',
                 f'[data-qa="{field_id}"]'
             ]
-            
-            for selector in selectors:
-                try:
-                    element = await context.wait_for_selector(selector, timeout=5000)
-                    if element:
-                        break
-                except:
-                    continue
-            
+
+            element = await self._first_matching_locator(context, selectors, cache_key=field_id)
+
             if not element:
                 self.logger.error(f"Could not find dropdown field: {field_id}")
                 return False
-            
-            # Scroll to element
-            await element.scroll_into_view_if_needed()
-            await self._smart_wait(100)
-            
-            # Check if it's a standard HTML select
-            tag_name = await element.evaluate('el => el.tagName.toLowerCase()')
-            
-            if tag_name == 'select':
+
+            # Check if it's a standard HTML select by selector probe - no
+            # separate tagName evaluate round-trip
+            is_native_select = await context.locator(
+                f'select#{field_id}, select[name="{field_id}"]').count() > 0
+
+            if is_native_select:
                 # Standard HTML select
                 try:
                     await element.select_option(label=value)
@@ -625,11 +1058,16 @@ class SimpleFormFiller:
             else:
                 # Custom dropdown (combobox) - fallback method
                 try:
-                    # Click to open dropdown
-                    await element.click()
-                    await self._smart_wait(300)
-                    
-                    # Look for option with matching text
+                    # Click to open dropdown and wait for options to render
+                    await element.click(no_wait_after=True)
+                    try:
+                        await context.locator('[role="option"]').first.wait_for(
+                            state='visible', timeout=self.timeouts['dropdown_load'])
+                    except Exception:
+                        pass
+
+                    # Race all option selectors in one bounded wait instead of
+                    # paying up to 3s per selector serially
                     option_selectors = [
                         f'[role="option"]:has-text("{value}")',
                         f'[role="listbox"] [role="option"]:has-text("{value}")',
@@ -637,18 +1075,20 @@ class SimpleFormFiller:
                         f'.option:has-text("{value}")',
                         f'[data-value*="{value.lower()}"]'
                     ]
-                    
+
+                    opt_loc = context.locator(option_selectors[0])
+                    for option_selector in option_selectors[1:]:
+                        opt_loc = opt_loc.or_(context.locator(option_selector))
+
                     option_found = False
-                    for option_selector in option_selectors:
-                        try:
-                            option = await context.wait_for_selector(option_selector, timeout=3000)
-                            if option:
-                                await option.click()
-                                option_found = True
-                                break
-                        except:
-                            continue
-                    
+                    try:
+                        option = opt_loc.first
+                        await option.wait_for(state='visible', timeout=3000)
+                        await option.click()
+                        option_found = True
+                    except Exception:
+                        pass
+
                     if not option_found:
                         # Try typing the value directly
                         await element.fill(value)
@@ -671,7 +1111,9 @@ class SimpleFormFiller:
             if not file_path or not os.path.exists(file_path):
                 self.logger.warning(f"File not found: {file_path}")
                 return False
-            
+
+            basename = os.path.basename(file_path)
+
             # Get the appropriate context (page or iframe frame)
             context = self._get_form_context()
             
@@ -681,101 +1123,80 @@ class SimpleFormFiller:
             # Method 1: Try by group label and "Attach" button (Greenhouse pattern)
             if field_label:
                 try:
-                    # Look for the group with the field label (e.g., "Resume/CV*")
-                    group = context.get_by_role('group', name=field_label).first
-                    if not group:
-                        # Try without asterisk
-                        clean_label = field_label.replace('*', '').strip()
-                        group = context.get_by_role('group', name=clean_label).first
-                    
-                    if group:
-                        # Find the "Attach" button within this group
-                        attach_button = group.get_by_role('button', name='Attach').first
-                        await attach_button.scroll_into_view_if_needed()
-                        await self._smart_wait(100)
-                        
-                        # Click the attach button to open file chooser
-                        async with page.expect_file_chooser() as fc_info:
-                            await attach_button.click()
-                        file_chooser = await fc_info.value
-                        
-                        # Set the file
-                        await file_chooser.set_files(file_path)
-                        await self._smart_wait(500)  # Wait for upload to process
-                        
-                        self.logger.info(f"Uploaded file using group method: {os.path.basename(file_path)}")
-                        return True
-                        
+                    # Look for the group with the field label; a single regex
+                    # matches both "Resume/CV" and "Resume/CV*" (Locators are
+                    # lazy, so a retry-on-falsy branch would never run)
+                    clean_label = field_label.replace('*', '').strip()
+                    label_re = re.compile(re.escape(clean_label) + r'\*?')
+                    group = context.get_by_role('group', name=label_re).first
+
+                    # Find the "Attach" button within this group
+                    attach_button = group.get_by_role('button', name='Attach').first
+                    await attach_button.scroll_into_view_if_needed()
+                    await self._smart_wait(100)
+
+                    # Click the attach button to open file chooser
+                    async with page.expect_file_chooser() as fc_info:
+                        await attach_button.click()
+                    file_chooser = await fc_info.value
+
+                    # Set the file
+                    await file_chooser.set_files(file_path)
+                    await self._smart_wait(500)  # Wait for upload to process
+
+                    self.logger.info(f"Uploaded file using group method: {basename}")
+                    return True
+
                 except Exception as e:
                     self.logger.debug(f"Group method failed for {field_id}: {e}")
             
-            # Method 2: Try to find file inputs more broadly
+            # Method 2: One query finds every file input, one evaluate reads
+            # their id/name/aria-label, and the matching runs in Python —
+            # instead of 6 selector queries and 3 attribute reads per element
             try:
-                # Try multiple selectors for file input - more comprehensive search
-                selectors = [
-                    f'#{field_id}',
-                    f'input[type="file"][id="{field_id}"]',
-                    f'input[type="file"][name="{field_id}"]',
-                    f'[data-qa="{field_id}"] input[type="file"]',
-                    f'[data-testid="{field_id}"] input[type="file"]',
-                    # Generic file upload patterns
-                    'input[type="file"]'
-                ]
-                
-                element = None
-                for selector in selectors:
-                    try:
-                        # File inputs are often hidden, so use query_selector_all
-                        elements = await context.query_selector_all(selector)
-                        for elem in elements:
-                            # Check if this might be the right file input
-                            elem_id = await elem.get_attribute('id') or ''
-                            elem_name = await elem.get_attribute('name') or ''
-                            elem_aria = await elem.get_attribute('aria-label') or ''
-                            
-                            # If we're looking for a specific field_id, try to match it
-                            if field_id in ['resume_cv', 'resume', 'cv']:
-                                if any(keyword in (elem_id + elem_name + elem_aria).lower() 
-                                      for keyword in ['resume', 'cv']):
-                                    element = elem
-                                    self.logger.info(f"Found resume file input via {selector}")
-                                    break
-                            elif field_id in ['cover_letter', 'cover']:
-                                if any(keyword in (elem_id + elem_name + elem_aria).lower() 
-                                      for keyword in ['cover', 'letter']):
-                                    element = elem
-                                    self.logger.info(f"Found cover letter file input via {selector}")
-                                    break
-                            elif elem_id == field_id or elem_name == field_id:
-                                element = elem
-                                self.logger.info(f"Found file input by exact match via {selector}")
-                                break
-                        
-                        if element:
+                inputs = await context.query_selector_all('input[type="file"]')
+                if inputs:
+                    infos = await context.evaluate('''els => els.map(el => ({
+                        id: el.id || '',
+                        name: el.name || '',
+                        aria: el.getAttribute('aria-label') || ''
+                    }))''', inputs)
+
+                    # Decide the match mode and keyword pattern once, outside
+                    # the per-candidate loop
+                    if field_id in ('resume_cv', 'resume', 'cv'):
+                        kw_re = re.compile(r'resume|cv', re.IGNORECASE)
+                        found_msg = "Found resume file input"
+                    elif field_id in ('cover_letter', 'cover'):
+                        kw_re = re.compile(r'cover|letter', re.IGNORECASE)
+                        found_msg = "Found cover letter file input"
+                    else:
+                        kw_re = None
+                        found_msg = "Found file input by exact match"
+
+                    element = None
+                    for candidate, info in zip(inputs, infos):
+                        if kw_re is not None:
+                            matched = kw_re.search(info['id'] + info['name'] + info['aria'])
+                        else:
+                            matched = info['id'] == field_id or info['name'] == field_id
+                        if matched:
+                            element = candidate
+                            self.logger.info(found_msg)
                             break
-                            
-                    except Exception as e:
-                        self.logger.debug(f"Error with selector {selector}: {e}")
-                        continue
-                
-                # If still not found, try the first available file input as fallback
-                if not element:
-                    try:
-                        all_file_inputs = await context.query_selector_all('input[type="file"]')
-                        if all_file_inputs:
-                            element = all_file_inputs[0]
-                            self.logger.warning(f"Using first available file input as fallback for {field_id}")
-                    except:
-                        pass
-                
-                if element:
+
+                    # If still not found, use the first available file input as fallback
+                    if not element:
+                        element = inputs[0]
+                        self.logger.warning(f"Using first available file input as fallback for {field_id}")
+
                     # Upload file using the traditional method
                     await element.set_input_files(file_path)
                     await self._smart_wait(500)  # Wait for upload to process
-                    
-                    self.logger.info(f"Uploaded file using traditional method: {os.path.basename(file_path)}")
+
+                    self.logger.info(f"Uploaded file using traditional method: {basename}")
                     return True
-                    
+
             except Exception as e:
                 self.logger.debug(f"Traditional file upload failed: {e}")
             
@@ -787,14 +1208,8 @@ class SimpleFormFiller:
             return False
     
     def _get_field_label_by_id(self, field_id: str) -> Optional[str]:
-        """Get the field label from form data by field ID."""
-        try:
-            for field in self.form_data.get('user_input_template', []):
-                if field.get('id') == field_id:
-                    return field.get('question', '')
-            return None
-        except:
-            return None
+        """Get the field label from the precomputed id -> question lookup."""
+        return self._field_label_by_id.get(field_id)
     
     async def _fill_textarea_field(self, page: Page, field_id: str, value: str) -> bool:
         """Fill textarea fields."""
@@ -802,36 +1217,23 @@ class SimpleFormFiller:
             # Get the appropriate context (page or iframe frame)
             context = self._get_form_context()
             
-            # Try multiple selectors for textarea
+            # Race all textarea selectors in one wait, memoized per field_id
             selectors = [
                 f'#{field_id}',
                 f'textarea[id="{field_id}"]',
                 f'textarea[name="{field_id}"]',
                 f'[data-qa="{field_id}"]'
             ]
-            
-            element = None
-            for selector in selectors:
-                try:
-                    element = await context.wait_for_selector(selector, timeout=5000)
-                    if element:
-                        break
-                except:
-                    continue
-            
+
+            element = await self._first_matching_locator(context, selectors, cache_key=field_id)
+
             if not element:
                 self.logger.error(f"Could not find textarea field: {field_id}")
                 return False
-            
-            # Scroll to element
-            await element.scroll_into_view_if_needed()
-            await self._smart_wait(100)
-            
-            # Fill textarea
-            await element.click()
-            await element.fill('')  # Clear first
+
+            # Fill textarea - fill() auto-waits, auto-scrolls, and clears
             await element.fill(value)
-            
+
             return True
             
         except Exception as e:
@@ -857,20 +1259,17 @@ class SimpleFormFiller:
                 '.modal-close'
             ]
             
-            for selector in dismiss_selectors:
+            # One combined query walks the DOM once instead of once per selector
+            elements = await context.query_selector_all(', '.join(dismiss_selectors))
+            for element in elements:
                 try:
-                    elements = await context.query_selector_all(selector)
-                    for element in elements:
-                        try:
-                            # Check if element is visible
-                            box = await element.bounding_box()
-                            if box and box['width'] > 0 and box['height'] > 0:
-                                await element.click(timeout=2000)
-                                await self._smart_wait(300)
-                                self.logger.info(f"Dismissed overlay with: {selector}")
-                                return  # Exit after first successful dismissal
-                        except:
-                            continue
+                    # Check if element is visible
+                    box = await element.bounding_box()
+                    if box and box['width'] > 0 and box['height'] > 0:
+                        await element.click(timeout=2000)
+                        await self._smart_wait(300)
+                        self.logger.info("Dismissed overlay")
+                        return  # Exit after first successful dismissal
                 except:
                     continue
                     
@@ -893,38 +1292,32 @@ class SimpleFormFiller:
         
         # Wait for user to indicate they're done
         try:
-            # Monitor for page navigation (which usually happens after submission)
+            # Race a navigation event against a success message appearing —
+            # both event-driven, so no 2s polling and no full-page text scans
             initial_url = self.page.url
-            
-            while True:
-                await asyncio.sleep(2)  # Check every 2 seconds
-                
-                try:
-                    current_url = self.page.url
-                    
-                    # Check if URL changed (form submitted)
-                    if current_url != initial_url:
-                        self.logger.info("🎉 Form submission detected! Program ending.")
-                        break
-                    
-                    # Check if page contains success indicators
-                    success_text = await self.page.evaluate('''() => {
-                        const text = document.body.innerText.toLowerCase();
-                        return text.includes('thank you') || 
-                               text.includes('application submitted') || 
-                               text.includes('successfully submitted') ||
-                               text.includes('application received');
-                    }''')
-                    
-                    if success_text:
-                        self.logger.info("🎉 Success message detected! Form appears to be submitted.")
-                        break
-                        
-                except Exception:
-                    # Page might be closed or navigated away
-                    self.logger.info("Browser closed or navigated away. Program ending.")
-                    break
-                    
+
+            nav_task = asyncio.create_task(
+                self.page.wait_for_url(lambda url: url != initial_url, timeout=0))
+            success_task = asyncio.create_task(
+                self.page.wait_for_selector(
+                    'text=/thank you|application (submitted|received)|successfully submitted/i',
+                    timeout=0))
+
+            done, pending = await asyncio.wait(
+                {nav_task, success_task}, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+
+            fired = next(iter(done))
+            if fired.exception() is None:
+                if fired is nav_task:
+                    self.logger.info("🎉 Form submission detected! Program ending.")
+                else:
+                    self.logger.info("🎉 Success message detected! Form appears to be submitted.")
+            else:
+                # Page was closed or navigated away
+                self.logger.info("Browser closed or navigated away. Program ending.")
+
         except KeyboardInterrupt:
             self.logger.info("Manual exit requested.")
         except Exception as e:
@@ -934,20 +1327,11 @@ class SimpleFormFiller:
             await self._cleanup_browser()
     
     async def _cleanup_browser(self):
-        """Properly cleanup browser resources to prevent Windows pipe exceptions."""
+        """Close this session's context; the browser stays warm for reuse."""
         try:
-            if self.browser:
-                # Close all contexts and pages first
-                if self.context:
-                    await self.context.close()
-                
-                # Then close the browser
-                await self.browser.close()
-                
-                # Small delay to allow cleanup
-                await asyncio.sleep(0.5)
-                
-                self.logger.info("Browser resources cleaned up successfully")
+            if self.context:
+                await self.context.close()
+                self.logger.info("Session context cleaned up successfully")
         except Exception as e:
             self.logger.debug(f"Error during browser cleanup: {e}")
         finally:
@@ -955,19 +1339,23 @@ class SimpleFormFiller:
             self.page = None
             self.context = None
             self.browser = None
+            self._context = None
+
+    @classmethod
+    async def shutdown(cls):
+        """Close warm browsers and stop the shared Playwright driver."""
+        for browser in cls._browser_cache.values():
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing warm browser: {e}")
+        cls._browser_cache.clear()
+        await _shutdown_playwright()
 
     def _is_location_field(self, field_id: str, field_question: str) -> bool:
         """Check if a field is location-related based on ID and question text."""
         try:
-            # Convert to lowercase for comparison
-            field_text = (field_id + ' ' + field_question).lower()
-            
-            # Check for location-related keywords
-            for keyword in self.geolocation_config['location_keywords']:
-                if keyword in field_text:
-                    return True
-            
-            return False
+            return bool(self._location_kw_re.search(field_id + ' ' + field_question))
         except:
             return False
     
@@ -1015,30 +1403,36 @@ class SimpleFormFiller:
                 'div:has-text("Use my location")'
             ]
             
-            # Try to find and click locate button
-            for selector in locate_selectors:
-                try:
-                    elements = await context.query_selector_all(selector)
-                    for element in elements:
-                        # Check if element is visible and interactable
-                        box = await element.bounding_box()
-                        if box and box['width'] > 0 and box['height'] > 0:
-                            # Scroll to element and make it visible
-                            await element.scroll_into_view_if_needed()
-                            await self._smart_wait(300)
-                            
-                            self.logger.info(f"📍 Found 'Locate me' button, clicking...")
-                            await element.click()
-                            
-                            # Wait for geolocation to process
-                            await self._smart_wait(self.geolocation_config['timeout'])
-                            
-                            self.logger.info("✅ Successfully clicked 'Locate me' button")
-                            return True
-                            
-                except Exception as e:
-                    self.logger.debug(f"Error with selector {selector}: {e}")
-                    continue
+            # One combined query plus one batched visibility read instead of
+            # a bounding_box round-trip per candidate
+            try:
+                elements = await context.query_selector_all(', '.join(locate_selectors))
+                infos = await context.evaluate('''els => els.map(el => {
+                    const r = el.getBoundingClientRect();
+                    return { w: r.width, h: r.height, clicked: !!el.dataset.__clicked };
+                })''', elements) if elements else []
+
+                for element, info in zip(elements, infos):
+                    if info['w'] > 0 and info['h'] > 0 and not info['clicked']:
+                        # Scroll to element and make it visible
+                        await element.scroll_into_view_if_needed()
+                        await self._smart_wait(300)
+
+                        self.logger.info(f"📍 Found 'Locate me' button, clicking...")
+                        await element.click()
+
+                        # Browser-side marker so the general pass that runs
+                        # afterwards doesn't click this button a second time
+                        await element.evaluate("el => el.dataset.__clicked = '1'")
+
+                        # Wait for geolocation to process
+                        await self._smart_wait(self.geolocation_config['timeout'])
+
+                        self.logger.info("✅ Successfully clicked 'Locate me' button")
+                        return True
+
+            except Exception as e:
+                self.logger.debug(f"Error scanning locate buttons: {e}")
             
             self.logger.debug(f"❌ No 'Locate me' button found for field: {field_question}")
             return False
@@ -1050,43 +1444,35 @@ class SimpleFormFiller:
     async def _check_location_auto_populated(self, context, field_id: str) -> bool:
         """Check if location field was auto-populated after clicking 'Locate me'."""
         try:
-            # Try to find the field and check if it has a value
-            selectors = [
-                f'#{field_id}',
-                f'select[id="{field_id}"]',
-                f'input[id="{field_id}"]',
-                f'[role="combobox"][id="{field_id}"]'
-            ]
-            
-            for selector in selectors:
-                try:
-                    element = await context.query_selector(selector)
-                    if element:
-                        # Check for value in different ways based on element type
-                        tag_name = await element.evaluate('el => el.tagName.toLowerCase()')
-                        
-                        if tag_name == 'select':
-                            selected_value = await element.evaluate('el => el.value')
-                            selected_text = await element.evaluate('el => el.options[el.selectedIndex]?.text || ""')
-                            if selected_value and selected_value != '' and selected_text and selected_text.strip() != '':
-                                self.logger.info(f"Location auto-populated: {selected_text}")
-                                return True
-                        elif tag_name == 'input':
-                            input_value = await element.input_value()
-                            if input_value and input_value.strip() != '':
-                                self.logger.info(f"Location auto-populated: {input_value}")
-                                return True
-                        else:
-                            # For custom dropdowns, check text content
-                            text_content = await element.text_content()
-                            if text_content and text_content.strip() != '' and 'select' not in text_content.lower():
-                                self.logger.info(f"Location auto-populated: {text_content}")
-                                return True
-                                
-                except Exception as e:
-                    self.logger.debug(f"Error checking auto-population with {selector}: {e}")
-                    continue
-            
+            # One joined query finds the field; one evaluate returns its tag,
+            # value, and display text together instead of three round-trips
+            element = await context.query_selector(
+                f'#{field_id}, select[id="{field_id}"], input[id="{field_id}"], '
+                f'[role="combobox"][id="{field_id}"]')
+            if not element:
+                return False
+
+            info = await element.evaluate('''el => {
+                const t = el.tagName.toLowerCase();
+                if (t === 'select') return { t, v: el.value, text: el.options[el.selectedIndex]?.text || '' };
+                if (t === 'input') return { t, v: el.value, text: el.value };
+                return { t, v: '', text: (el.textContent || '').trim() };
+            }''')
+
+            if info['t'] == 'select':
+                if info['v'] and info['text'].strip():
+                    self.logger.info(f"Location auto-populated: {info['text']}")
+                    return True
+            elif info['t'] == 'input':
+                if info['v'].strip():
+                    self.logger.info(f"Location auto-populated: {info['v']}")
+                    return True
+            else:
+                # For custom dropdowns, check text content
+                if info['text'] and 'select' not in info['text'].lower():
+                    self.logger.info(f"Location auto-populated: {info['text']}")
+                    return True
+
             return False
             
         except Exception as e:
@@ -1105,42 +1491,42 @@ class SimpleFormFiller:
             context = self._get_form_context()
             
             # Method 1: Field-specific approach - find location fields and their locate buttons
-            location_fields = []
-            for field_data in form_data.get('user_input_template', []):
-                field_id = field_data['id']
-                field_question = field_data['question']
-                
-                if self._is_location_field(field_id, field_question):
-                    location_fields.append({
-                        'id': field_id,
-                        'question': field_question,
-                        'type': field_data['type']
-                    })
+            location_fields = [
+                {'id': f['id'], 'question': f['question'], 'type': f['type']}
+                for f in form_data.get('user_input_template', [])
+                if self._is_location_field(f['id'], f['question'])
+            ]
             
             locate_buttons_found = 0
-            
+
             if location_fields:
                 self.logger.info(f"📋 Found {len(location_fields)} location field(s): {[f['question'] for f in location_fields]}")
-                
-                # Try to find "Locate me" buttons for specific location fields
-                for field in location_fields:
+
+                # Each field's locate button is independent, so process them
+                # concurrently and overlap the geolocation waits; a small
+                # stagger keeps the clicks from landing simultaneously
+                async def _process_location_field(index: int, field: Dict[str, Any]) -> bool:
+                    await asyncio.sleep(0.1 * index)
                     self.logger.info(f"📍 Processing location field: {field['question']}")
-                    
+
                     locate_success = await self._handle_locate_me_button(context, field['id'], field['question'])
-                    
+
                     if locate_success:
-                        locate_buttons_found += 1
                         # Wait for geolocation to process
                         await self._smart_wait(2000)
-                        
+
                         # Check if location was auto-populated
                         if await self._check_location_auto_populated(context, field['id']):
                             self.logger.info(f"✅ Location auto-populated for: {field['question']}")
                         else:
                             self.logger.info(f"⚠️ Location not auto-populated for: {field['question']}")
-                    
-                    # Small delay between fields
-                    await self._smart_wait(500)
+
+                    return locate_success
+
+                results = await asyncio.gather(
+                    *(_process_location_field(i, f) for i, f in enumerate(location_fields)),
+                    return_exceptions=True)
+                locate_buttons_found = sum(1 for r in results if r is True)
             
             # Method 2: General approach - search for any locate buttons on the page
             self.logger.info("\n🔍 Performing comprehensive search for all 'Locate me' buttons...")
@@ -1169,92 +1555,55 @@ class SimpleFormFiller:
         try:
             self.logger.info("🌐 Performing general search for all 'Locate me' buttons...")
             
-            # Comprehensive selectors for any "Locate me" button on the page
-            general_locate_selectors = [
-                # Text-based - most common patterns
-                'button:has-text("Locate me")',
-                'button:has-text("Use my location")',
-                'button:has-text("Current location")',
-                'button:has-text("Detect location")',
-                'button:has-text("Auto-detect")',
-                'a:has-text("Locate me")',
-                'a:has-text("Use my location")',
-                'span:has-text("Locate me")',
-                
-                # Class/ID patterns
-                '.locate-me',
-                '.location-btn',
-                '.geo-locate',
-                '.use-location',
-                '.detect-location',
-                '.auto-location',
-                '#locate-me',
-                '#location-btn',
-                
-                # Data attributes
-                '[data-testid*="locate"]',
-                '[data-testid*="location"]',
-                '[data-qa*="locate"]',
-                '[data-qa*="location"]',
-                
-                # ARIA labels
-                '[aria-label*="locate"]',
-                '[aria-label*="location"]',
-                '[aria-label*="detect location"]',
-                
-                # Title attributes
-                '[title*="locate"]',
-                '[title*="location"]',
-                '[title*="gps"]',
-                
-                # Icon-based (GPS symbols)
-                'button[class*="gps"]',
-                'button[class*="location"]'
-            ]
-            
             buttons_clicked = 0
-            clicked_elements = set()  # To avoid clicking the same button twice
-            
-            for selector in general_locate_selectors:
-                try:
-                    elements = await context.query_selector_all(selector)
-                    for element in elements:
-                        # Check if we already clicked this element
-                        element_handle = str(element)
-                        if element_handle in clicked_elements:
-                            continue
-                        
-                        # Check if element is visible and interactable
-                        box = await element.bounding_box()
-                        if box and box['width'] > 0 and box['height'] > 0:
-                            # Get element text to confirm it's a locate button
-                            text_content = await element.text_content() or ""
-                            inner_text = await element.inner_text() or ""
-                            combined_text = (text_content + " " + inner_text).lower()
-                            
-                            # Verify it's actually a locate button
-                            locate_keywords = ['locate', 'location', 'gps', 'detect', 'auto-detect', 'current']
-                            if any(keyword in combined_text for keyword in locate_keywords):
-                                try:
-                                    await element.scroll_into_view_if_needed()
-                                    await self._smart_wait(300)
-                                    
-                                    self.logger.info(f"📍 Clicking locate button: '{combined_text.strip()}'")
-                                    await element.click()
-                                    
-                                    clicked_elements.add(element_handle)
-                                    buttons_clicked += 1
-                                    
-                                    # Wait between clicks
-                                    await self._smart_wait(1000)
-                                    
-                                except Exception as e:
-                                    self.logger.debug(f"Error clicking locate button: {e}")
-                                    continue
-                            
-                except Exception as e:
-                    self.logger.debug(f"Error with general selector {selector}: {e}")
-                    continue
+
+            # Buttons tagged by the MutationObserver init script — covers
+            # elements rendered at any point, not just at scan time
+            elements = await context.query_selector_all('[data-locate="1"]')
+
+            if not elements:
+                # Frames the init script didn't reach still get a direct
+                # scan: the pure-CSS pass first (native querySelectorAll),
+                # the :has-text engine only when it finds nothing
+                elements = await context.query_selector_all(_LOCATE_CSS_SELECTOR)
+
+            if not elements:
+                elements = await context.query_selector_all(_LOCATE_TEXT_SELECTOR)
+
+            # One evaluate reads visibility and text for every candidate,
+            # skips buttons the per-field pass already clicked (browser-side
+            # dataset.__clicked marker, authoritative across passes) and
+            # marks the rest as claimed. textContent is enough for keyword
+            # matching and, unlike innerText, doesn't force layout
+            infos = await context.evaluate('''els => els.flatMap((el, i) => {
+                if (el.dataset.__clicked) return [];
+                el.dataset.__clicked = '1';
+                const r = el.getBoundingClientRect();
+                return [{
+                    i, w: r.width, h: r.height,
+                    text: (el.textContent || '').trim()
+                }];
+            })''', elements) if elements else []
+
+            for info in infos:
+                element = elements[info['i']]
+                # Check visibility and verify it's actually a locate button
+                if info['w'] > 0 and info['h'] > 0 and _LOCATE_KW_RE.search(info['text']):
+                    try:
+                        await element.scroll_into_view_if_needed()
+                        await self._smart_wait(300)
+
+                        self.logger.info(f"📍 Clicking locate button: '{info['text']}'")
+                        await element.click()
+
+                        buttons_clicked += 1
+
+                        # Wait between clicks
+                        await self._smart_wait(1000)
+
+                    except Exception as e:
+                        self.logger.debug(f"Error clicking locate button: {e}")
+                        continue
             
             if buttons_clicked > 0:
                 self.logger.info(f"🎯 Clicked {buttons_clicked} 'Locate me' button(s) in total")
@@ -1269,136 +1618,270 @@ class SimpleFormFiller:
             self.logger.error(f"Error in general locate button search: {e}")
             return 0
 
-    def _get_real_location(self) -> Dict[str, Any]:
-        """Get real location coordinates using IP-based geolocation with multiple fallback options."""
+    async def _get_real_location_cached(self) -> Dict[str, Any]:
+        """Get location coordinates, skipping the network lookup when cached.
+
+        Checks the process-wide cache first, then a persistent cache file in
+        the log directory; only falls back to the geocoder lookup when both
+        miss or the cached entry is older than cache_ttl.
+        """
+        # In-process hit: repeated fill_form calls don't even touch disk
+        if SimpleFormFiller._location_cache is not None:
+            return SimpleFormFiller._location_cache
+
+        # Single-flight: when parallel fills race here, the first caller
+        # does the lookup and the rest await its future, so N concurrent
+        # callers cost one lookup instead of N
+        if SimpleFormFiller._location_future is not None:
+            return await SimpleFormFiller._location_future
+        future = asyncio.get_running_loop().create_future()
+        SimpleFormFiller._location_future = future
+        try:
+            coordinates = await self._lookup_location_uncached()
+            future.set_result(coordinates)
+            return coordinates
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved in case nobody is waiting
+            raise
+        finally:
+            # Allow a fresh attempt later; successes land in _location_cache
+            SimpleFormFiller._location_future = None
+
+    async def _lookup_location_uncached(self) -> Dict[str, Any]:
+        """Resolve coordinates via the disk cache or a fresh lookup."""
+        cache_file = Path.home() / '.job-automator' / 'geolocation.json'
+
+        # Disk hit: reuse coordinates from a previous run if fresh enough
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = _loads(f.read())
+            age = time.time() - cached.get('timestamp', 0)
+            if age < self.geolocation_config['cache_ttl']:
+                coordinates = cached['coordinates']
+                self.logger.info(f"📍 Using cached location: ({coordinates['latitude']}, {coordinates['longitude']})")
+                SimpleFormFiller._location_cache = coordinates
+                return coordinates
+        except (FileNotFoundError, ValueError, KeyError, OSError):
+            pass
+
+        coordinates = await self._get_real_location()
+
+        # Persist for the next run (best-effort; skip fallback coordinates
+        # so a transient lookup failure doesn't stick for a week)
+        if coordinates.get('accuracy'):
+            try:
+                cache_file.parent.mkdir(exist_ok=True)
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump({'coordinates': coordinates, 'timestamp': time.time()}, f)
+            except OSError as e:
+                self.logger.debug(f"Could not write location cache: {e}")
+
+        # Same guard as the disk write: never pin fallback coordinates in
+        # the process-wide cache, so the next fill retries the real lookup
+        if coordinates.get('accuracy'):
+            SimpleFormFiller._location_cache = coordinates
+        return coordinates
+
+    async def _get_real_location(self) -> Dict[str, Any]:
+        """Get real location coordinates using IP-based geolocation.
+
+        All providers are queried concurrently in worker threads so the
+        latency is bounded by the fastest one instead of summed over serial
+        fallbacks, and the sync HTTP calls never block the event loop.
+        """
         try:
-            if not GEOCODER_AVAILABLE:
+            try:
+                import geocoder
+            except ImportError:
                 self.logger.warning("❌ Geocoder library not available, using San Francisco as fallback")
+                self.logger.warning("   Install with: pip install geocoder")
                 return self._get_fallback_coordinates()
-            
+
             self.logger.info("🌍 Detecting your real location...")
-            
-            # Method 1: Try geocoder.ip() for general IP location
+
+            # Race all geocoder providers; first usable answer wins
+            services = ('ip', 'ipapi', 'freegeoip', 'ipinfo')
+            tasks = [
+                asyncio.create_task(asyncio.to_thread(lambda s=s: getattr(geocoder, s)('me')))
+                for s in services
+            ]
             try:
-                g = geocoder.ip('me')
-                if g.ok and g.latlng:
-                    coordinates = {
-                        'latitude': g.latlng[0],
-                        'longitude': g.latlng[1],
-                        'accuracy': 10000  # IP-based is less precise (10km radius)
-                    }
-                    self.logger.info(f"✅ Location detected via IP: {g.city}, {g.country} ({coordinates['latitude']}, {coordinates['longitude']})")
-                    return coordinates
-            except Exception as e:
-                self.logger.debug(f"geocoder.ip() failed: {e}")
-            
-            # Method 2: Try specific IP geolocation services
-            services = ['ipapi', 'freegeoip', 'ipinfo']
-            for service in services:
-                try:
-                    g = getattr(geocoder, service)('me')
+                for future in asyncio.as_completed(tasks, timeout=self.timeouts['geolocation'] / 1000):
+                    try:
+                        g = await future
+                    except Exception as e:
+                        self.logger.debug(f"geocoder lookup failed: {e}")
+                        continue
                     if g.ok and g.latlng:
                         coordinates = {
                             'latitude': g.latlng[0],
                             'longitude': g.latlng[1],
-                            'accuracy': 10000
+                            'accuracy': 10000  # IP-based is less precise (10km radius)
                         }
-                        self.logger.info(f"✅ Location detected via {service}: {g.city}, {g.country} ({coordinates['latitude']}, {coordinates['longitude']})")
+                        # %-style args so the string is only formatted when
+                        # INFO records are actually emitted
+                        self.logger.info("✅ Location detected via IP: %s, %s (%s, %s)",
+                                         g.city, g.country, coordinates['latitude'], coordinates['longitude'])
                         return coordinates
-                except Exception as e:
-                    self.logger.debug(f"geocoder.{service}() failed: {e}")
-                    continue
-            
-            # Method 3: Manual IP lookup fallback
+            except asyncio.TimeoutError:
+                self.logger.debug("All geocoder providers timed out")
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            # Manual IP lookup fallback: race the JSON endpoints directly so
+            # the latency is min() across providers instead of summed, and
+            # the event loop stays free for any concurrent browser work
             try:
-                import requests
-                response = requests.get('http://ip-api.com/json/', timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('status') == 'success':
-                        coordinates = {
-                            'latitude': data['lat'],
-                            'longitude': data['lon'],
-                            'accuracy': 10000
-                        }
-                        self.logger.info(f"✅ Location detected via ip-api.com: {data.get('city')}, {data.get('country')} ({coordinates['latitude']}, {coordinates['longitude']})")
+                import httpx
+
+                # Tight split timeouts: a stuck provider burns ~2s, not 5s,
+                # before the race falls through to the next answer
+                timeout = httpx.Timeout(2.0, connect=1.0)
+                async with httpx.AsyncClient(timeout=timeout) as client:
+                    tasks = [asyncio.create_task(client.get(url)) for url in _IP_LOOKUP_URLS]
+                    try:
+                        for future in asyncio.as_completed(tasks, timeout=3):
+                            try:
+                                response = await future
+                            except Exception as e:
+                                self.logger.debug(f"IP lookup provider failed: {e}")
+                                continue
+                            if response.status_code != 200:
+                                continue
+                            coordinates = self._parse_ip_payload(response.json())
+                            if coordinates:
+                                return coordinates
+                    except asyncio.TimeoutError:
+                        self.logger.debug("All IP lookup providers timed out")
+                    finally:
+                        for task in tasks:
+                            task.cancel()
+            except ImportError:
+                # httpx missing: stdlib lookup off the event loop — one
+                # small JSON GET doesn't justify the requests import tree
+                try:
+                    def _ip_api_lookup():
+                        import urllib.request
+                        with urllib.request.urlopen(_IP_API_URL, timeout=3) as r:
+                            return _loads(r.read()) if r.status == 200 else None
+
+                    data = await asyncio.to_thread(_ip_api_lookup)
+                    coordinates = self._parse_ip_payload(data) if data else None
+                    if coordinates:
                         return coordinates
+                except Exception as e:
+                    self.logger.debug(f"Manual IP lookup failed: {e}")
             except Exception as e:
                 self.logger.debug(f"Manual IP lookup failed: {e}")
-            
+
             self.logger.warning("❌ Could not detect real location, using San Francisco as fallback")
-            
+
         except Exception as e:
             self.logger.warning(f"Error detecting location: {e}")
-        
+
         # Fallback to San Francisco coordinates
         return self._get_fallback_coordinates()
     
+    def _parse_ip_payload(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract coordinates from an IP-lookup payload, any provider shape.
+
+        Handles ip-api.com (lat/lon), ipapi.co (latitude/longitude) and
+        ipinfo.io ("loc": "lat,lon") payloads; returns None when the
+        payload is unusable.
+        """
+        try:
+            if data.get('status') == 'fail':
+                return None
+
+            if 'lat' in data and 'lon' in data:
+                latitude, longitude = data['lat'], data['lon']
+            elif 'latitude' in data and 'longitude' in data:
+                latitude, longitude = data['latitude'], data['longitude']
+            elif 'loc' in data:
+                lat_str, _, lon_str = data['loc'].partition(',')
+                latitude, longitude = float(lat_str), float(lon_str)
+            else:
+                return None
+
+            coordinates = {
+                'latitude': latitude,
+                'longitude': longitude,
+                'accuracy': 10000
+            }
+            self.logger.info("✅ Location detected via IP lookup: %s, %s (%s, %s)",
+                             data.get('city'), data.get('country'), latitude, longitude)
+            return coordinates
+        except Exception as e:
+            self.logger.debug(f"Could not parse IP lookup response: {e}")
+            return None
+
     def _get_fallback_coordinates(self) -> Dict[str, Any]:
         """Get fallback San Francisco coordinates."""
-        fallback_coordinates = {
-            'latitude': 37.7749,  # San Francisco coordinates
-            'longitude': -122.4194,
-            'accuracy': 0
-        }
-        self.logger.info(f"📍 Using fallback coordinates: San Francisco ({fallback_coordinates['latitude']}, {fallback_coordinates['longitude']})")
-        return fallback_coordinates
+        self.logger.info("📍 Using fallback coordinates: San Francisco (37.7749, -122.4194)")
+        return _FALLBACK_COORDS
 
-async def main():
-    """Main function to run the form filler."""
-    if len(sys.argv) != 2:
-        print("Usage: python simple_form_filler.py <path_to_filled_json>")
+async def main(argv: Optional[List[str]] = None):
+    """Main function to run the form filler.
+
+    Accepts argv explicitly so callers can invoke it in-process without
+    touching sys.argv; the CLI entry point passes nothing and gets the
+    usual behavior.
+    """
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 2:
+        print("Usage: python simple_form_filler.py <path_to_filled_json> [more_json_files...]")
         print("Example: python simple_form_filler.py test_filled_form.json")
         return
-    
-    json_file = sys.argv[1]
-    
-    if not os.path.exists(json_file):
-        print(f"Error: File '{json_file}' not found")
-        return
-    
+
+    json_files = argv[1:]
+
+    # One filler for all files: the browser launch, stealth setup and
+    # location lookup happen once, and each extra file only pays for a
+    # fresh context. Fills run serially because each one opens a visible
+    # window and waits for the user to submit.
+    # No exists check here: _load_form_data opens the file directly and
+    # reports a missing path itself (one open instead of stat + open)
     filler = SimpleFormFiller()
-    success = await filler.fill_form(json_file)
-    
-    if success:
-        print("\n✅ Form filling completed successfully!")
+    results = []
+    try:
+        for json_file in json_files:
+            success = await filler.fill_form(json_file)
+            results.append((json_file, success))
+    finally:
+        # Tear down the shared driver cleanly so no pipes leak at exit
+        await SimpleFormFiller.shutdown()
+
+    if len(results) == 1:
+        if results[0][1]:
+            print("\n✅ Form filling completed successfully!")
+        else:
+            print("\n❌ Form filling failed. Check logs for details.")
     else:
-        print("\n❌ Form filling failed. Check logs for details.")
+        succeeded = sum(1 for _, ok in results if ok)
+        print(f"\n📋 Form filling finished: {succeeded}/{len(results)} succeeded")
+        for json_file, ok in results:
+            print(f"   {'✅' if ok else '❌'} {json_file}")
 
 def suppress_asyncio_warnings():
     """Suppress Windows asyncio pipe cleanup warnings."""
-    import sys
     if sys.platform == "win32":
-        # Redirect stderr temporarily to suppress pipe warnings
-        import io
-        import contextlib
-        
-        @contextlib.contextmanager
-        def suppress_stderr():
-            with open(os.devnull, "w") as devnull:
-                old_stderr = sys.stderr
-                sys.stderr = devnull
-                try:
-                    yield
-                finally:
-                    sys.stderr = old_stderr
-        
-        return suppress_stderr()
+        # redirect_stderr does the swap-and-restore itself; the ExitStack
+        # guarantees the devnull handle closes when the context exits
+        stack = contextlib.ExitStack()
+        devnull = stack.enter_context(open(os.devnull, "w"))
+        stack.enter_context(contextlib.redirect_stderr(devnull))
+        return stack
     else:
         return contextlib.nullcontext()
 
 if __name__ == "__main__":
     try:
-        # Suppress warnings for Windows
-        if sys.platform == "win32":
-            import contextlib
-            # Temporarily suppress stderr during cleanup
-            asyncio.run(main())
-            # Give a moment for cleanup, then suppress any remaining warnings
-            import time
-            time.sleep(0.1)
-        else:
-            asyncio.run(main())
+        # asyncio.run already drains the loop and cancels leftover tasks,
+        # and the ResourceWarning filters at the top of the module cover
+        # the Proactor pipe noise — no post-run sleep needed
+        asyncio.run(main())
     except KeyboardInterrupt:
         print("\n⚠️ Program interrupted by user")
     except Exception as e:
@@ -10,24 +10,41 @@ for seamless integration with Claude Desktop and other MCP clients.
 """
 
 import asyncio
+import atexit
+import itertools
 import json
 import logging
+import queue
+import re
 import sys
 import os
+import time
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime, timedelta
+from urllib.parse import urlparse, urlsplit
 
 from mcp.server.fastmcp import FastMCP
 from mcp.types import TextContent
 
+# Try to use orjson for fast JSON serialization, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from playwright.async_api import async_playwright
+
 # Handle imports for both module and script execution
 try:
-    from .form_extractor import SimpleFormExtractor
+    from .form_extractor import SimpleFormExtractor, BROWSER_LAUNCH_ARGS
     from .form_filler import SimpleFormFiller
 except ImportError:
     # Fallback for direct script execution
-    from form_extractor import SimpleFormExtractor
+    from form_extractor import SimpleFormExtractor, BROWSER_LAUNCH_ARGS
     from form_filler import SimpleFormFiller
 
 # Configure logging
@@ -45,25 +62,80 @@ except (PermissionError, OSError):
     # Fallback to temporary directory
     log_file = Path(tempfile.gettempdir()) / 'job_automator_mcp_server.log'
 
+# Route records through a queue so logger calls on the event loop just
+# enqueue; a background listener thread does the blocking file/console writes
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler(log_file, encoding='utf-8')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# Repo-root artifact locations, resolved (and the directories created)
+# once at import instead of stat/mkdir per tool call
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_EXTRACT_DIR = _REPO_ROOT / "extracted_form_data"
+_COVER_DIR = _REPO_ROOT / "cover_letters"
+_APPLIED_LOG = _REPO_ROOT / "applied_jobs.txt"
+for _artifact_dir in (_EXTRACT_DIR, _COVER_DIR):
+    try:
+        _artifact_dir.mkdir(exist_ok=True)
+    except OSError as _mkdir_error:
+        logger.warning(f"Could not create {_artifact_dir}: {_mkdir_error}")
+
+def _dump_json(path: Path, obj: Any) -> None:
+    """Write obj to path compactly and atomically.
+
+    Encodes with the fastest available encoder, writes to a sibling temp
+    file and os.replace()s it into place so readers never see a partial
+    dump.
+    """
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    if ORJSON_AVAILABLE:
+        # orjson emits UTF-8 bytes directly; one write, no text layer
+        tmp_path.write_bytes(orjson.dumps(obj))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+# Server identity, shared by the FastMCP instance and health_check
+_SERVER_NAME = "form-automation-server"
+_VERSION = "1.0.0"
+
 # Initialize FastMCP server
-mcp = FastMCP("form-automation-server")
+mcp = FastMCP(_SERVER_NAME)
 
-# Global state to maintain form filling process
-form_filling_state = {
-    "browser_active": False,
-    "current_session": None,
-    "form_data": None
-}
+# URL schemes accepted by the extraction tools
+_ALLOWED_SCHEMES = frozenset(("http", "https"))
+
+# Monotonic suffix for extraction output filenames; cheaper than formatting
+# microseconds per file and collision-proof within the process
+_FILE_COUNTER = itertools.count()
+
+# Process-wide cap on concurrent extractions, shared across tool calls so
+# back-to-back invocations from an agent loop queue up instead of piling
+# five contexts each onto the machine at once
+_EXTRACT_SEM = asyncio.Semaphore(5)
+
+# Global state to maintain form filling process; fixed keys, so slotted
+# attributes replace dict hashing on every access
+@dataclass(slots=True)
+class FormFillingState:
+    browser_active: bool = False
+    current_session: Optional[Any] = None
+    form_data: Optional[Dict[str, Any]] = None
+
+form_filling_state = FormFillingState()
 
 @mcp.tool()
 async def simple_form_extraction(url: Optional[str] = None, urls: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -136,35 +208,39 @@ async def simple_form_extraction(url: Optional[str] = None, urls: Optional[List[
         if len(url_list) > 5:
             raise ValueError("Maximum of 5 URLs allowed per call")
 
-        # Basic validation
+        # Basic validation: one urlsplit per URL checks scheme and host
+        # together instead of prefix-matching strings
         for u in url_list:
-            if not u or not isinstance(u, str) or not u.startswith(('http://', 'https://')):
+            parts = urlsplit(u) if u and isinstance(u, str) else None
+            if parts is None or parts.scheme not in _ALLOWED_SCHEMES or not parts.netloc:
                 raise ValueError(f"Invalid URL provided: {u}. URL must start with http:// or https://")
 
         logger.info(f"Starting form extraction for {len(url_list)} URL(s)")
 
-        # Ensure output directory exists
-        extracted_data_dir = Path(__file__).parent.parent / "extracted_form_data"
-        extracted_data_dir.mkdir(exist_ok=True)
+        # Output directory was created at import
+        extracted_data_dir = _EXTRACT_DIR
 
-        # Concurrency limit (parallel but bounded)
-        concurrency = min(5, len(url_list))
-        sem = asyncio.Semaphore(concurrency)
-
-        async def extract_one(target_url: str) -> Dict[str, Any]:
-            async with sem:
+        async def extract_one(target_url: str, browser) -> Dict[str, Any]:
+            # Bounded by the shared process-wide semaphore
+            async with _EXTRACT_SEM:
                 try:
                     logger.info(f"Extracting form for URL: {target_url}")
+                    # Fresh extractor per URL (it carries per-extraction
+                    # state) but one shared browser: each task only pays
+                    # for a context, not a Chromium launch
                     extractor = SimpleFormExtractor()
-                    form_data = await extractor.extract_form_data(target_url)
+                    form_data = await extractor.extract_form_data(target_url, browser=browser)
 
-                    # Unique filename with microseconds to avoid collisions in parallel writes
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-                    output_file = f"extracted_form_data_{timestamp}.json"
+                    # Second-resolution timestamp plus a process-wide counter
+                    # keeps filenames unique across parallel writes without
+                    # microsecond formatting
+                    timestamp = time.strftime("%Y%m%d_%H%M%S")
+                    output_file = f"extracted_form_data_{timestamp}_{next(_FILE_COUNTER)}.json"
                     output_path = extracted_data_dir / output_file
 
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        json.dump(form_data, f, indent=2, ensure_ascii=False)
+                    # Encode+write in a worker thread so the event loop
+                    # keeps driving the other extractions meanwhile
+                    await asyncio.to_thread(_dump_json, output_path, form_data)
 
                     logger.info(f"Form extraction complete for {target_url}. Fields: {form_data.get('total_fields', 0)}")
 
@@ -192,9 +268,23 @@ async def simple_form_extraction(url: Optional[str] = None, urls: Optional[List[
                         "error_details": str(e)
                     }
 
-        # Run extractions in parallel
-        tasks = [asyncio.create_task(extract_one(u)) for u in url_list]
-        results = await asyncio.gather(*tasks)
+        # Run extractions in parallel on one shared browser
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=False, args=BROWSER_LAUNCH_ARGS)
+            try:
+                # One task per distinct URL; duplicate entries await the
+                # same extraction instead of opening another context for it
+                unique = {}
+                for u in url_list:
+                    if u not in unique:
+                        unique[u] = asyncio.create_task(extract_one(u, browser))
+                await asyncio.gather(*unique.values())
+                results = [unique[u].result() for u in url_list]
+            finally:
+                try:
+                    await browser.close()
+                except Exception as close_error:
+                    logger.debug(f"Error closing shared browser: {close_error}")
 
         success_count = sum(1 for r in results if r.get("status") == "success")
         error_count = len(results) - success_count
@@ -219,24 +309,53 @@ async def simple_form_extraction(url: Optional[str] = None, urls: Optional[List[
             "results": []
         }
 
+# Applied-jobs log entries go through a queue drained by one background
+# task, so logging a submission costs a queue put instead of an
+# open/append cycle; queued entries are coalesced into a single write
+_applied_log_queue: Optional[asyncio.Queue] = None
+_applied_log_task = None
+
+async def _applied_log_writer() -> None:
+    """Drain the applied-jobs queue, batching entries per write."""
+    while True:
+        entries = [await _applied_log_queue.get()]
+        while not _applied_log_queue.empty() and len(entries) < 64:
+            entries.append(_applied_log_queue.get_nowait())
+        try:
+            with open(_APPLIED_LOG, 'a', encoding='utf-8') as f:
+                f.write(''.join(entries))
+        except Exception as e:
+            logger.error(f"Failed to write applied-jobs log: {e}")
+
 def _log_job_application(url: str, job_title: str, company: str) -> None:
     """Log job application details to applied_jobs.txt file."""
+    global _applied_log_queue, _applied_log_task
     try:
-        # Create applied_jobs.txt file path
-        applied_jobs_file = Path(__file__).parent.parent / "applied_jobs.txt"
-        
         # Get current timestamp
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
+
         # Format log entry - only timestamp and URL
         log_entry = f"{timestamp} | {url}\n"
-        
-        # Append to file (create if doesn't exist)
-        with open(applied_jobs_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
-        
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            # Queue it; the writer task appends in the background
+            if _applied_log_queue is None:
+                _applied_log_queue = asyncio.Queue()
+            if _applied_log_task is None or _applied_log_task.done():
+                _applied_log_task = loop.create_task(_applied_log_writer())
+            _applied_log_queue.put_nowait(log_entry)
+        else:
+            # No running loop (e.g. direct sync use): append inline
+            with open(_APPLIED_LOG, 'a', encoding='utf-8') as f:
+                f.write(log_entry)
+
         logger.info(f"Logged job application: {url}")
-        
+
     except Exception as e:
         logger.error(f"Failed to log job application: {e}")
 
@@ -337,8 +456,6 @@ async def simple_form_filling(form_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         A dictionary indicating the success/failure of the form filling operation
     """
-    global form_filling_state
-    
     try:
         logger.info("Starting form filling process")
         
@@ -365,62 +482,55 @@ async def simple_form_filling(form_data: Dict[str, Any]) -> Dict[str, Any]:
             raise ValueError("URL is required")
         if not user_input_template:
             raise ValueError("user_input_template is required")
-        
+
+        # One pass over the template checks each entry's shape and counts
+        # the fields that actually carry a value
+        template_fields = 0
+        filled_fields_count = 0
+        for field in user_input_template:
+            if not isinstance(field, dict) or not isinstance(field.get('id'), str):
+                raise ValueError(f"Invalid user_input_template entry: {field!r}")
+            template_fields += 1
+            value = field.get('value')
+            if value and str(value).strip():
+                filled_fields_count += 1
+
         logger.info(f"Processing form data for: {job_title} at {company}")
         logger.info(f"Form URL: {url}")
-        logger.info(f"Total fields to fill: {len(user_input_template)}")
-        
-        # Save form data to a temporary JSON file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        temp_file = f"temp_form_data_{timestamp}.json"
-        temp_path = Path(__file__).parent.parent / temp_file
-        
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            json.dump(form_data, f, indent=2, ensure_ascii=False)
-        
-        logger.info(f"Form data saved to temporary file: {temp_file}")
+        logger.info(f"Total fields to fill: {template_fields}")
         
         # Initialize form filler
         filler = SimpleFormFiller()
-        
+
         # Log the job application
         _log_job_application(url, job_title, company)
-        
+
         # Store state for potential cleanup
-        form_filling_state["form_data"] = form_data
-        form_filling_state["temp_file"] = temp_path
-        
+        form_filling_state.form_data = form_data
+
         # Start form filling in background (non-blocking)
         # This allows the MCP tool to return success while the browser continues running
         async def fill_form_background():
             try:
-                form_filling_state["browser_active"] = True
-                success = await filler.fill_form(str(temp_path))
-                
+                form_filling_state.browser_active = True
+                # Hand the dict straight to the filler — no temp-file
+                # serialize/read-back/unlink round trip
+                success = await filler.fill_form_data(form_data)
+
                 if success:
                     logger.info("Form filling completed successfully - browser remains open for user review")
                 else:
                     logger.error("Form filling failed")
-                    
+
             except Exception as e:
                 logger.error(f"Background form filling error: {e}")
             finally:
-                form_filling_state["browser_active"] = False
-                # Clean up temp file
-                try:
-                    if temp_path.exists():
-                        temp_path.unlink()
-                        logger.info(f"Cleaned up temporary file: {temp_file}")
-                except Exception as cleanup_error:
-                    logger.warning(f"Could not clean up temp file: {cleanup_error}")
-        
+                form_filling_state.browser_active = False
+
         # Start the background task
         asyncio.create_task(fill_form_background())
         
         # Return success immediately while form filling continues in background
-        filled_fields_count = len([field for field in user_input_template 
-                                 if field.get('value') and str(field.get('value', '')).strip()])
-        
         return {
             "status": "success",
             "message": "Form filling process started successfully",
@@ -431,21 +541,13 @@ async def simple_form_filling(form_data: Dict[str, Any]) -> Dict[str, Any]:
             "total_fields": total_fields,
             "browser_status": "opening",
             "note": "The browser will open and fill the form. It will remain open for you to review and submit manually.",
-            "temp_data_file": temp_file,
             "form_structure": "Using core fields: url, form_context, user_input_template (additional fields ignored)"
         }
-        
+
     except Exception as e:
         error_msg = f"Form filling failed: {str(e)}"
         logger.error(error_msg)
-        
-        # Clean up temp file if it was created
-        if 'temp_path' in locals() and temp_path.exists():
-            try:
-                temp_path.unlink()
-            except Exception:
-                pass
-        
+
         return {
             "status": "error",
             "message": error_msg,
@@ -487,17 +589,13 @@ async def create_cover_letter(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Clean company and job title for filename (remove special characters)
-        safe_company = "".join(c for c in company_name if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe_job = "".join(c for c in job_title if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe_company = safe_company.replace(' ', '_')
-        safe_job = safe_job.replace(' ', '_')
+        safe_company = _UNSAFE_FILENAME_RE.sub('', company_name).strip().replace(' ', '_')
+        safe_job = _UNSAFE_FILENAME_RE.sub('', job_title).strip().replace(' ', '_')
         
         # Create filename
         filename = f"cover_letter_{safe_company}_{safe_job}_{timestamp}.txt"
-        # Save to cover_letters directory
-        cover_letters_dir = Path(__file__).parent.parent / "cover_letters"
-        cover_letters_dir.mkdir(exist_ok=True)  # Ensure directory exists
-        file_path = cover_letters_dir / filename
+        # Save to cover_letters directory (created at import)
+        file_path = _COVER_DIR / filename
         
         # Format the cover letter content
         formatted_content = f"""Dear Hiring Manager,
@@ -513,10 +611,12 @@ Company: {company_name}
 Created: {datetime.now().strftime("%B %d, %Y")}
 """
         
-        # Write the cover letter to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(formatted_content)
-        
+        # Hand the write to a worker thread and respond immediately; the
+        # content is already in hand, so nothing below depends on the file
+        asyncio.create_task(
+            asyncio.to_thread(file_path.write_text, formatted_content, 'utf-8')
+        )
+
         logger.info(f"Cover letter created successfully: {filename}")
         
         return {
@@ -526,7 +626,7 @@ Created: {datetime.now().strftime("%B %d, %Y")}
             "filename": filename,
             "company_name": company_name,
             "job_title": job_title,
-            "file_size_bytes": file_path.stat().st_size,
+            "file_size_bytes": len(formatted_content.encode('utf-8')),
             "created_timestamp": datetime.now().isoformat()
         }
         
@@ -541,6 +641,134 @@ Created: {datetime.now().strftime("%B %d, %Y")}
             "job_title": job_title
         }
 
+# Known career-site hosts mapped straight to company names: one dict
+# lookup per line instead of a chain of substring scans
+_COMPANY_BY_HOST = {
+    'careers.google.com': 'Google',
+    'careers.microsoft.com': 'Microsoft',
+    'jobs.apple.com': 'Apple',
+    'metacareers.com': 'Meta',
+    'amazon.jobs': 'Amazon',
+    'meraki.cisco.com': 'Cisco',
+}
+_GREENHOUSE_RE = re.compile(r'greenhouse\.io/([^/?#]+)')
+
+# Characters allowed in generated filenames; everything else is stripped
+# in one C-level pass rather than a per-character Python loop
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9 _-]+')
+
+def _company_from_url(url: str) -> str:
+    """Best-effort company name for an application URL."""
+    try:
+        host = urlparse(url).netloc.lower().removeprefix('www.')
+    except Exception:
+        return "Unknown Company"
+
+    company = _COMPANY_BY_HOST.get(host)
+    if company:
+        return company
+
+    # ATS hosts: greenhouse URLs carry the company slug in the path
+    if host.endswith('greenhouse.io'):
+        match = _GREENHOUSE_RE.search(url)
+        return match.group(1).title() if match else "Company (via Greenhouse)"
+    if host.endswith('workday.com'):
+        return "Company (via Workday)"
+    if host.endswith('lever.co'):
+        return "Company (via Lever)"
+
+    # Fall back to the domain name itself
+    for suffix in ('.com', '.org', '.net'):
+        if host.endswith(suffix):
+            host = host[:-len(suffix)]
+            break
+    return host.title() if host else "Unknown Company"
+
+# Parsed applied_jobs.txt entries keyed on the file's (mtime, size), so
+# repeat dashboard calls skip re-parsing and appends only parse new bytes
+_APPLIED_CACHE = {"mtime": 0.0, "size": 0, "entries": []}
+
+def _parse_applied_line(line: str) -> Optional[Dict[str, str]]:
+    """Parse one applied_jobs.txt line into an application dict, or None.
+
+    Supports both formats: timestamp|url and timestamp|company|job_title|url.
+    """
+    line = line.strip()
+    if not line or '|' not in line:
+        return None
+    try:
+        parts = [part.strip() for part in line.split('|')]
+
+        if len(parts) == 2:
+            # New format: timestamp | url
+            timestamp, url = parts[0], parts[1]
+            company = _company_from_url(url)
+            job_title = "Job Application"
+
+        elif len(parts) >= 4:
+            # Old format: timestamp | company | job_title | url
+            timestamp, company, job_title, url = parts[0], parts[1], parts[2], parts[3]
+
+            # Handle N/A values from old format
+            if company == "N/A" or not company:
+                company = "Unknown Company"
+                # Try to detect from URL
+                if 'meraki.cisco.com' in url:
+                    company = "Cisco"
+                elif 'clickhouse' in url.lower():
+                    company = "ClickHouse"
+
+            if job_title == "N/A" or not job_title:
+                job_title = "Job Application"
+
+        else:
+            # Invalid format, skip
+            return None
+
+        # Parse the timestamp once here; sorting, rendering and the stats
+        # all reuse it instead of calling strptime again per consumer
+        try:
+            dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            dt = None
+
+        return {
+            'timestamp': timestamp,
+            'dt': dt,
+            'company': company,
+            'job_title': job_title,
+            'url': url
+        }
+
+    except Exception as e:
+        logger.debug(f"Error parsing line: {line} - {e}")
+        return None
+
+def _load_applications(applied_jobs_file: Path) -> List[Dict[str, str]]:
+    """Return parsed applications, reusing the cache when possible.
+
+    A matching (mtime, size) reuses the cached entries outright; a pure
+    append seeks past the already-parsed bytes and only parses the new
+    tail; anything else (truncate, rewrite) falls back to a full parse.
+    """
+    st = applied_jobs_file.stat()
+    if (st.st_mtime, st.st_size) == (_APPLIED_CACHE["mtime"], _APPLIED_CACHE["size"]):
+        return _APPLIED_CACHE["entries"]
+
+    entries = _APPLIED_CACHE["entries"]
+    with open(applied_jobs_file, 'rb') as f:
+        if 0 < _APPLIED_CACHE["size"] < st.st_size:
+            f.seek(_APPLIED_CACHE["size"])
+        else:
+            entries = []
+        for raw_line in f:
+            app = _parse_applied_line(raw_line.decode('utf-8', errors='replace'))
+            if app:
+                entries.append(app)
+
+    _APPLIED_CACHE.update(mtime=st.st_mtime, size=st.st_size, entries=entries)
+    return entries
+
 @mcp.tool()
 async def get_applied_jobs() -> str:
     """
@@ -559,8 +787,8 @@ async def get_applied_jobs() -> str:
     """
     try:
         # Path to applied jobs log file
-        applied_jobs_file = Path(__file__).parent.parent / "applied_jobs.txt"
-        
+        applied_jobs_file = _APPLIED_LOG
+
         # Check if file exists
         if not applied_jobs_file.exists():
             return """# 📋 Applied Jobs Dashboard
@@ -573,91 +801,13 @@ You haven't applied to any jobs yet. Start applying to see your application hist
 *This dashboard automatically tracks all job applications made through the form filler tool.*
 """
         
-        # Read and parse the log file
-        applications = []
-        with open(applied_jobs_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Parse each line (supports both formats: timestamp|url AND timestamp|company|job_title|url)
-        for line in lines:
-            line = line.strip()
-            if line and '|' in line:
-                try:
-                    parts = [part.strip() for part in line.split('|')]
-                    
-                    if len(parts) == 2:
-                        # New format: timestamp | url
-                        timestamp, url = parts[0], parts[1]
-                        company = "Unknown Company"
-                        job_title = "Job Application"
-                        
-                        # Try to extract company from common URL patterns
-                        if 'careers.google.com' in url:
-                            company = "Google"
-                        elif 'careers.microsoft.com' in url:
-                            company = "Microsoft"
-                        elif 'jobs.apple.com' in url:
-                            company = "Apple"
-                        elif 'metacareers.com' in url:
-                            company = "Meta"
-                        elif 'amazon.jobs' in url:
-                            company = "Amazon"
-                        elif 'meraki.cisco.com' in url:
-                            company = "Cisco"
-                        elif 'greenhouse.io' in url:
-                            # Extract company from greenhouse URLs
-                            try:
-                                company_part = url.split('greenhouse.io/')[1].split('/')[0]
-                                company = company_part.title()
-                            except:
-                                company = "Company (via Greenhouse)"
-                        elif 'workday.com' in url:
-                            company = "Company (via Workday)"
-                        elif 'lever.co' in url:
-                            company = "Company (via Lever)"
-                        else:
-                            # Try to extract domain name as company
-                            try:
-                                from urllib.parse import urlparse
-                                domain = urlparse(url).netloc
-                                if domain:
-                                    company = domain.replace('www.', '').replace('.com', '').replace('.org', '').replace('.net', '').title()
-                            except:
-                                pass
-                        
-                    elif len(parts) >= 4:
-                        # Old format: timestamp | company | job_title | url
-                        timestamp, company, job_title, url = parts[0], parts[1], parts[2], parts[3]
-                        
-                        # Handle N/A values from old format
-                        if company == "N/A" or not company:
-                            company = "Unknown Company"
-                            # Try to detect from URL
-                            if 'meraki.cisco.com' in url:
-                                company = "Cisco"
-                            elif 'clickhouse' in url.lower():
-                                company = "ClickHouse"
-                        
-                        if job_title == "N/A" or not job_title:
-                            job_title = "Job Application"
-                    
-                    else:
-                        # Invalid format, skip
-                        continue
-                    
-                    applications.append({
-                        'timestamp': timestamp,
-                        'company': company,
-                        'job_title': job_title,
-                        'url': url
-                    })
-                    
-                except Exception as e:
-                    logger.debug(f"Error parsing line: {line} - {e}")
-                    continue
-        
-        # Sort by timestamp (most recent first)
-        applications.sort(key=lambda x: x['timestamp'], reverse=True)
+        # Load entries (cached across calls; appends parse only new bytes).
+        # The stat/read runs in a worker thread so a cold or large log
+        # never blocks the MCP receive loop from serving other tool calls
+        applications = list(await asyncio.to_thread(_load_applications, applied_jobs_file))
+
+        # Sort by timestamp (most recent first; unparseable ones sink)
+        applications.sort(key=lambda x: x['dt'] or datetime.min, reverse=True)
         
         # Generate beautiful markdown content
         if not applications:
@@ -671,69 +821,90 @@ The log file exists but contains no valid application entries.
 *This dashboard automatically tracks all job applications made through the form filler tool.*
 """
         
-        # Create markdown content
-        markdown_content = f"""# 📋 Applied Jobs Dashboard
+        # Build the markdown as a list of chunks and join once at the end
+        # (repeated += on a growing string is quadratic); datetime.now()
+        # is read once for the header and the stats
+        now = datetime.now()
+        parts = [f"""# 📋 Applied Jobs Dashboard
 
 ## 🎯 Application Summary
 - **Total Applications:** {len(applications)}
-- **Last Updated:** {datetime.now().strftime("%B %d, %Y at %I:%M %p")}
+- **Last Updated:** {now.strftime("%B %d, %Y at %I:%M %p")}
 
 ---
 
 ## 📈 Recent Applications
 
-"""
-        
+"""]
+
         # Add each application
         for i, app in enumerate(applications, 1):
-            # Format timestamp for better readability
-            try:
-                dt = datetime.strptime(app['timestamp'], "%Y-%m-%d %H:%M:%S")
+            # Format timestamp for better readability (parsed at ingestion)
+            dt = app['dt']
+            if dt:
                 formatted_date = dt.strftime("%B %d, %Y")
                 formatted_time = dt.strftime("%I:%M %p")
-            except:
+            else:
                 formatted_date = app['timestamp']
                 formatted_time = ""
-            
-            markdown_content += f"""### {i}. {app['job_title']}
+
+            parts.append(f"""### {i}. {app['job_title']}
 **🏢 Company:** {app['company']}  
 **📅 Applied:** {formatted_date} at {formatted_time}  
 **🔗 Application URL:** {app['url']}
 
 ---
 
-"""
-        
+""")
+
+        # One pass over the applications for the footer stats, parsing
+        # each timestamp at most once instead of one comprehension (and up
+        # to two strptime calls) per metric
+        companies = set()
+        month_prefix = now.strftime('%Y-%m')
+        week_ago = now.date() - timedelta(days=7)
+        month_count = week_count = 0
+        for app in applications:
+            companies.add(app['company'])
+            if app['timestamp'].startswith(month_prefix):
+                month_count += 1
+            if app['dt'] and app['dt'].date() >= week_ago:
+                week_count += 1
+
         # Add footer
-        markdown_content += f"""
+        parts.append(f"""
 ## 📊 Statistics
 
 | Metric | Value |
 |--------|-------|
 | Total Applications | {len(applications)} |
-| Unique Companies | {len(set(app['company'] for app in applications))} |
-| This Month | {len([app for app in applications if app['timestamp'].startswith(datetime.now().strftime('%Y-%m'))])} |
-| This Week | {len([app for app in applications if datetime.now().date() - datetime.strptime(app['timestamp'], '%Y-%m-%d %H:%M:%S').date() <= timedelta(days=7)])} |
+| Unique Companies | {len(companies)} |
+| This Month | {month_count} |
+| This Week | {week_count} |
 
 ---
 
 *🤖 Automated tracking via Form Automation MCP Server*  
 *📝 Applications logged by timestamp and URL (company names auto-detected from URLs)*
-"""
-        
-        return markdown_content
+""")
+
+        return "".join(parts)
         
     except Exception as e:
         error_msg = f"Error retrieving applied jobs: {str(e)}"
         logger.error(error_msg)
-        return f"""# 📋 Applied Jobs Dashboard
+        return _APPLIED_JOBS_ERROR_TEMPLATE.format(error_msg)
+
+# Static skeleton of the applied-jobs failure page; only the error
+# message varies per occurrence
+_APPLIED_JOBS_ERROR_TEMPLATE = """# 📋 Applied Jobs Dashboard
 
 ## ❌ Error Loading Applications
 
 An error occurred while loading your job applications:
 
 ```
-{error_msg}
+{}
 ```
 
 Please check the log files and try again.
@@ -742,36 +913,50 @@ Please check the log files and try again.
 *This dashboard automatically tracks all job applications made through the form filler tool.*
 """
 
+# Status timestamps only need coarse freshness; under burst polling this
+# shares one datetime construction per 100ms instead of one per call
+_last_ts = [0.0, ""]
+
+def _fast_now_iso() -> str:
+    """ISO timestamp, cached at 100ms granularity via the monotonic clock."""
+    m = time.monotonic()
+    if m - _last_ts[0] > 0.1 or not _last_ts[1]:
+        _last_ts[0] = m
+        _last_ts[1] = datetime.now().isoformat()
+    return _last_ts[1]
+
+# Tool names are fixed; one shared tuple serves every health_check response
+_TOOLS_AVAILABLE = (
+    "simple_form_extraction",
+    "simple_form_filling",
+    "create_cover_letter",
+    "get_applied_jobs",
+    "health_check"
+)
+
 # Add a health check tool
 @mcp.tool()
 async def health_check() -> Dict[str, Any]:
     """
     Check the health status of the form automation server.
-    
+
     Returns:
         A dictionary containing the server status and active processes
     """
+    state = form_filling_state
     return {
         "status": "healthy",
-        "server": "form-automation-server",
-        "version": "1.0.0",
-        "browser_active": form_filling_state.get("browser_active", False),
-        "current_session": form_filling_state.get("current_session") is not None,
-        "timestamp": datetime.now().isoformat(),
-        "tools_available": [
-            "simple_form_extraction",
-            "simple_form_filling",
-            "create_cover_letter",
-            "get_applied_jobs",
-            "health_check"
-        ]
+        "server": _SERVER_NAME,
+        "version": _VERSION,
+        "browser_active": state.browser_active,
+        "current_session": state.current_session is not None,
+        "timestamp": _fast_now_iso(),
+        "tools_available": _TOOLS_AVAILABLE
     }
 
-# Add a resource for server information
-@mcp.resource("server://info")
-def get_server_info() -> str:
-    """Get information about the form automation server."""
-    return f"""# Form Automation Server
+# The server-info document is static apart from two status fields, so the
+# skeleton is built once at import and only those fields are formatted per read
+_SERVER_INFO_TEMPLATE = """# Form Automation Server
 
 This MCP server provides form automation capabilities for job applications and other web forms.
 
@@ -819,10 +1004,19 @@ Checks the server health and active processes.
 
 ## Server Status:
 - Version: 1.0.0
-- Active: {form_filling_state.get('browser_active', False)}
-- Timestamp: {datetime.now().isoformat()}
+- Active: {active}
+- Timestamp: {timestamp}
 """
 
+# Add a resource for server information
+@mcp.resource("server://info")
+def get_server_info() -> str:
+    """Get information about the form automation server."""
+    return _SERVER_INFO_TEMPLATE.format(
+        active=form_filling_state.browser_active,
+        timestamp=_fast_now_iso()
+    )
+
 def main():
     """Main entry point for the MCP server."""
     logger.info("Starting Form Automation MCP Server...")
@@ -831,7 +1025,14 @@ def main():
     logger.info("Form Automation Server v1.0.0")
     logger.info("Available tools: simple_form_extraction, simple_form_filling, create_cover_letter, get_applied_jobs, health_check")
     logger.info("Protocol: Model Context Protocol (MCP)")
-    
+
+    # The server speaks JSON-RPC over stdio; push each small response out
+    # immediately instead of letting the text layer buffer it
+    try:
+        sys.stdout.reconfigure(write_through=True)
+    except (AttributeError, ValueError) as e:
+        logger.debug(f"Could not reconfigure stdout: {e}")
+
     try:
         # Run the FastMCP server
         mcp.run()
@@ -11,8 +11,21 @@ import json
 import shutil
 import platform
 import argparse
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Platform name is immutable for the process; resolve it once
+_SYSTEM = platform.system().lower()
+
+# Try to use orjson for fast JSON serialization, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Fix Windows encoding issues
 if sys.platform == "win32":
     # Ensure UTF-8 encoding for Windows
@@ -23,52 +36,57 @@ if sys.platform == "win32":
     # Set environment variable for child processes
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-# Safe emoji printing for cross-platform compatibility
-def safe_print(text):
-    """Print text with emoji fallback for Windows console issues."""
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        # Replace common emojis with text equivalents for Windows compatibility
-        fallback_text = text
-        emoji_replacements = {
-            "🚀": "[*]",
-            "📦": "[+]", 
-            "✅": "[OK]",
-            "❌": "[FAIL]",
-            "⚠️": "[WARN]",
-            "🔧": "[TOOL]",
-            "🎉": "[SUCCESS]",
-            "📋": "[INFO]",
-            "🟢": "[GOOD]",
-            "🟡": "[OK]",
-            "🟠": "[BASIC]", 
-            "🔴": "[ERROR]",
-            "💡": "[TIP]",
-            "🔄": "[UPDATE]",
-            "📁": "[FOLDER]",
-            "🐍": "[PYTHON]",
-            "🤖": "[BOT]",
-            "🌐": "[NET]",
-            "🔐": "[SECURE]",
-            "🎭": "[BROWSER]",
-            "🟢": "[GOOD]"
-        }
-        for emoji, replacement in emoji_replacements.items():
-            fallback_text = fallback_text.replace(emoji, replacement)
-        print(fallback_text)
-
-def run_command(command, description):
-    """Run a shell command and handle errors."""
-    safe_print(f"📦 {description}...")
-    try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        safe_print(f"✅ {description} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        safe_print(f"❌ {description} failed: {e}")
-        safe_print(f"Error output: {e.stderr}")
-        return False
+# Emoji-to-text translation table, built once at import; str.translate
+# replaces everything in a single pass instead of one scan per emoji.
+# Keys must be single characters, so the warning sign maps alone and the
+# variation selector that follows it is dropped.
+_EMOJI_TRANS = str.maketrans({
+    "🚀": "[*]",
+    "📦": "[+]",
+    "✅": "[OK]",
+    "❌": "[FAIL]",
+    "⚠": "[WARN]",
+    "️": "",
+    "🔧": "[TOOL]",
+    "🎉": "[SUCCESS]",
+    "📋": "[INFO]",
+    "🟢": "[GOOD]",
+    "🟡": "[OK]",
+    "🟠": "[BASIC]",
+    "🔴": "[ERROR]",
+    "💡": "[TIP]",
+    "🔄": "[UPDATE]",
+    "📁": "[FOLDER]",
+    "🐍": "[PYTHON]",
+    "🤖": "[BOT]",
+    "🌐": "[NET]",
+    "🔐": "[SECURE]",
+    "🎭": "[BROWSER]"
+})
+
+# A UTF-8-capable stdout can never raise UnicodeEncodeError on emoji, so
+# the fallback wrapper only exists where it can actually fire (probed once;
+# the Windows reconfigure above already ran)
+_NEEDS_EMOJI_FALLBACK = (getattr(sys.stdout, 'encoding', None) or '').lower() not in ("utf-8", "utf8", "cp65001")
+
+if _NEEDS_EMOJI_FALLBACK:
+    def _safe_print_unicode(text):
+        try:
+            print(text)
+        except UnicodeEncodeError:
+            # Replace common emojis with text equivalents for Windows compatibility
+            print(text.translate(_EMOJI_TRANS))
+
+    # Safe emoji printing for cross-platform compatibility
+    def safe_print(text):
+        """Print text with emoji fallback for Windows console issues.
+
+        Pure-ASCII lines (banners, blank separators) can never raise
+        UnicodeEncodeError, so they bypass the try/except wrapper.
+        """
+        (print if text.isascii() else _safe_print_unicode)(text)
+else:
+    safe_print = print
 
 def check_python():
     """Check Python installation."""
@@ -84,48 +102,51 @@ def check_python():
         safe_print(f"❌ Python check failed: {e}")
         return False
 
+def _probe_version(cmd):
+    """Run `<cmd> --version` and return the version string, or the error."""
+    try:
+        result = subprocess.run([cmd, "--version"], capture_output=True, text=True, check=True, timeout=10)
+        return result.stdout.strip(), None
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
+        return None, e
+
 def check_nodejs():
     """Check Node.js and npm/npx installation."""
     safe_print("🔧 Checking Node.js prerequisites...")
-    
-    # Check Node.js
-    node_version = None
-    try:
-        result = subprocess.run(["node", "--version"], capture_output=True, text=True, check=True, timeout=10)
-        node_version = result.stdout.strip()
+
+    # The three probes are independent process spawns; run them
+    # concurrently and apply the node -> npm -> npx gating to the results
+    npm_cmd = "npm.cmd" if _SYSTEM == "windows" else "npm"
+    npx_cmd = "npx.cmd" if _SYSTEM == "windows" else "npx"
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        node_result, npm_result, npx_result = executor.map(
+            _probe_version, ["node", npm_cmd, npx_cmd])
+
+    node_version, node_error = node_result
+    node_ok = node_error is None
+    if node_ok:
         safe_print(f"✅ Node.js {node_version} - OK")
-        node_ok = True
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-        safe_print(f"❌ Node.js - MISSING (Error: {e})")
-        node_ok = False
-    
-    # Check npm (Windows-specific handling)
-    npm_version = None
+    else:
+        safe_print(f"❌ Node.js - MISSING (Error: {node_error})")
+
+    # Check npm (only reported when Node.js itself is present)
+    npm_version, npm_error = npm_result
+    npm_ok = node_ok and npm_error is None
     if node_ok:
-        npm_cmd = "npm.cmd" if platform.system().lower() == "windows" else "npm"
-        try:
-            result = subprocess.run([npm_cmd, "--version"], capture_output=True, text=True, check=True, timeout=10)
-            npm_version = result.stdout.strip()
+        if npm_ok:
             safe_print(f"✅ npm {npm_version} - OK")
-            npm_ok = True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-            safe_print(f"❌ npm - MISSING (Error: {e})")
-            npm_ok = False
-    else:
-        npm_ok = False
-    
-    # Check npx (Windows-specific handling)
-    npx_ok = False
+        else:
+            safe_print(f"❌ npm - MISSING (Error: {npm_error})")
+
+    # Check npx (only reported when npm is present)
+    npx_version, npx_error = npx_result
+    npx_ok = npm_ok and npx_error is None
     if npm_ok:
-        npx_cmd = "npx.cmd" if platform.system().lower() == "windows" else "npx"
-        try:
-            result = subprocess.run([npx_cmd, "--version"], capture_output=True, text=True, check=True, timeout=10)
-            npx_version = result.stdout.strip()
+        if npx_ok:
             safe_print(f"✅ npx {npx_version} - OK")
-            npx_ok = True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-            safe_print(f"❌ npx - MISSING (Error: {e})")
-    
+        else:
+            safe_print(f"❌ npx - MISSING (Error: {npx_error})")
+
     return node_ok and npm_ok and npx_ok
 
 def show_nodejs_installation_guide():
@@ -137,7 +158,7 @@ def show_nodejs_installation_guide():
     safe_print("To enable job matching features, please install Node.js:")
     safe_print("")
     
-    system = platform.system().lower()
+    system = _SYSTEM
     
     if system == "windows":
         safe_print("🪟 Windows Installation:")
@@ -193,50 +214,55 @@ def show_nodejs_installation_guide():
     safe_print("")
     safe_print("="*60)
 
+@functools.lru_cache(maxsize=1)
+def _locate_mcp_binary():
+    """Find the job-automator-mcp executable, caching the filesystem probes.
+
+    Returns the resolved path, or None if nothing was found.
+    """
+    # Method 1: Try to find using shutil.which (works for global installs)
+    mcp_command = shutil.which("job-automator-mcp")
+    if mcp_command:
+        return mcp_command
+
+    binary_name = "job-automator-mcp.exe" if os.name == 'nt' else "job-automator-mcp"
+    python_dir = Path(sys.executable).parent
+
+    # Methods 2 and 3: the Python executable's directory, then its Scripts
+    # subdirectory (Windows virtual env). One scandir per directory lists
+    # all entries instead of a stat() per candidate path
+    for candidate_dir in (python_dir, python_dir / "Scripts"):
+        try:
+            with os.scandir(candidate_dir) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            continue
+        if binary_name in names:
+            return str(candidate_dir / binary_name)
+
+    return None
+
+@functools.cache
+def _claude_config_dir():
+    """Resolve the Claude Desktop config directory once per process."""
+    if os.name == 'nt':  # Windows
+        return Path.home() / "AppData" / "Roaming" / "Claude"
+    # macOS/Linux
+    return Path.home() / "Library" / "Application Support" / "Claude"
+
 def setup_claude_desktop_config():
     """Set up Claude Desktop configuration."""
     safe_print("\n🔧 Configuring Claude Desktop...")
-    
-    # Claude Desktop config paths
-    if os.name == 'nt':  # Windows
-        config_dir = Path.home() / "AppData" / "Roaming" / "Claude"
-    else:  # macOS/Linux
-        config_dir = Path.home() / "Library" / "Application Support" / "Claude"
-    
+
+    config_dir = _claude_config_dir()
     config_file = config_dir / "claude_desktop_config.json"
-    
+
     # Create config directory if it doesn't exist
     config_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Find the job-automator-mcp executable
-    mcp_command = None
-    
-    # Method 1: Try to find using shutil.which (works for global installs)
-    mcp_command = shutil.which("job-automator-mcp")
-    
-    if not mcp_command:
-        # Method 2: Check in same directory as current Python executable
-        python_dir = Path(sys.executable).parent
-        if os.name == 'nt':  # Windows
-            potential_path = python_dir / "job-automator-mcp.exe"
-        else:  # macOS/Linux
-            potential_path = python_dir / "job-automator-mcp"
-        
-        if potential_path.exists():
-            mcp_command = str(potential_path)
-    
-    if not mcp_command:
-        # Method 3: Check in Scripts subdirectory (Windows virtual env)
-        scripts_dir = Path(sys.executable).parent / "Scripts"
-        if scripts_dir.exists():
-            if os.name == 'nt':
-                potential_path = scripts_dir / "job-automator-mcp.exe"
-            else:
-                potential_path = scripts_dir / "job-automator-mcp"
-            
-            if potential_path.exists():
-                mcp_command = str(potential_path)
-    
+
+    # Find the job-automator-mcp executable (probed once per process)
+    mcp_command = _locate_mcp_binary()
+
     if not mcp_command:
         # Fallback: use just the command name and hope it's in PATH
         mcp_command = "job-automator-mcp"
@@ -246,51 +272,45 @@ def setup_claude_desktop_config():
     
     return mcp_command, config_file
 
-def setup_job_automator_server(mcp_command, config_file):
-    """Set up the job-automator (local) MCP server."""
-    safe_print("🔧 Setting up job-automator MCP server...")
-    
+def _read_claude_config(config_file):
+    """Parse the Claude config file with the fastest available decoder."""
+    with open(config_file, 'r', encoding='utf-8') as f:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(f.read())
+        return json.load(f)
+
+def _write_claude_config(config_file, config):
+    """Write the Claude config with 2-space indentation."""
+    with open(config_file, 'w', encoding='utf-8') as f:
+        if ORJSON_AVAILABLE:
+            f.write(orjson.dumps(
+                config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            ).decode())
+        else:
+            json.dump(config, f, indent=2)
+
+def setup_mcp_servers(mcp_command, config_file):
+    """Set up the job-automator and job-matcher MCP servers in one pass."""
+    safe_print("🔧 Setting up job-automator and job-matcher MCP servers...")
+
     # Read existing config if it exists
     existing_config = {}
     if config_file.exists():
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                existing_config = json.load(f)
-        except json.JSONDecodeError:
+            existing_config = _read_claude_config(config_file)
+        except ValueError:
             safe_print("⚠️  Existing Claude config file is invalid, creating new one")
-    
+
     # Ensure mcpServers section exists
     if "mcpServers" not in existing_config:
         existing_config["mcpServers"] = {}
-    
-    # Add job-automator server
+
+    # Add job-automator (local) server
     existing_config["mcpServers"]["job-automator"] = {
         "command": mcp_command
     }
-    
-    # Write the updated config
-    try:
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(existing_config, f, indent=2)
-        safe_print("✅ job-automator MCP server configured")
-        return True
-    except Exception as e:
-        safe_print(f"❌ Failed to configure job-automator MCP server: {e}")
-        return False
 
-def setup_job_matcher_server(config_file):
-    """Set up the job-matcher (remote) MCP server."""
-    safe_print("🔧 Setting up job-matcher MCP server...")
-    
-    # Read existing config
-    try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            existing_config = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        safe_print("❌ Could not read Claude config file")
-        return False
-    
-    # Add job-matcher server
+    # Add job-matcher (remote) server
     existing_config["mcpServers"]["job-matcher"] = {
         "command": "npx",
         "args": [
@@ -298,83 +318,45 @@ def setup_job_matcher_server(config_file):
             "https://mcp-job-matcher.stmovva.workers.dev"
         ]
     }
-    
-    # Write the updated config
+
+    # Write the updated config once for both servers
     try:
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(existing_config, f, indent=2)
+        _write_claude_config(config_file, existing_config)
+        safe_print("✅ job-automator MCP server configured")
         safe_print("✅ job-matcher MCP server configured")
         return True
     except Exception as e:
-        safe_print(f"❌ Failed to configure job-matcher MCP server: {e}")
+        safe_print(f"❌ Failed to configure MCP servers: {e}")
         return False
 
 def test_mcp_server():
     """Test the MCP server installation."""
     safe_print("🧪 Testing MCP server...")
-    
-    server_path = Path(__file__).parent / "form_automation_server.py"
-    
-    # Test that the server can be imported
+
+    # Resolve the modules without executing them — find_spec only walks
+    # the import machinery, so validation stays milliseconds instead of
+    # pulling in Playwright and FastMCP
     try:
         # Add the project directory to Python path for testing
         project_dir = Path(__file__).parent.parent
         sys.path.insert(0, str(project_dir))
-        
-        # Try to import the server modules
-        from simple_form_extractor import SimpleFormExtractor
-        from simple_form_filler import SimpleFormFiller
-        safe_print("✅ Form automation modules imported successfully")
-        
-        # Validate server exists
-        try:
-            import job_application_automator.mcp_server
-            safe_print("✅ MCP server module found")
-        except ImportError:
+
+        for module_name in ("job_application_automator.form_extractor",
+                            "job_application_automator.form_filler"):
+            if importlib.util.find_spec(module_name) is None:
+                safe_print(f"❌ Form automation module not found: {module_name}")
+                return False
+        safe_print("✅ Form automation modules found")
+
+        if importlib.util.find_spec("job_application_automator.mcp_server") is None:
             safe_print("❌ MCP server module not found")
             return False
-        
+        safe_print("✅ MCP server module found")
+
         return True
     except Exception as e:
         safe_print(f"❌ Validation failed: {e}")
         return False
-    
-    # Setup Claude Desktop config
-    if not setup_claude_desktop_config():
-        safe_print("❌ Claude Desktop configuration failed")
-        sys.exit(1)
-    
-    safe_print("\n🎉 Setup completed successfully!")
-    safe_print("\n📋 Next steps:")
-    safe_print("1. Restart Claude Desktop application")
-    safe_print("2. Look for the form automation tools in Claude Desktop")
-    safe_print("3. Test with: 'Extract form data from [URL]'")
-    safe_print("\n🔧 Available tools:")
-    safe_print("- simple_form_extraction: Extract form fields from any URL")
-    safe_print("- simple_form_filling: Fill forms with provided data")
-    safe_print("- health_check: Check server status")
-    
-    safe_print(f"\n📁 Server location: {Path(__file__).parent / 'form_automation_server.py'}")
-    safe_print(f"📁 Config location: {Path.home() / 'Library/Application Support/Claude/claude_desktop_config.json' if os.name != 'nt' else Path.home() / 'AppData/Roaming/Claude/claude_desktop_config.json'}")
-
-def show_success_message(config_file):
-    """Show brief success message after successful setup."""
-    safe_print("\n" + "="*60)
-    safe_print("🎉 Setup completed successfully!")
-    safe_print("="*60)
-    safe_print("")
-    safe_print("✅ Both MCP servers configured:")
-    safe_print("   • job-automator: Form extraction, filling, cover letters")
-    safe_print("   • job-matcher: Resume-based job matching")
-    safe_print("")
-    safe_print("📋 Next steps:")
-    safe_print("1. Restart Claude Desktop application")
-    safe_print("2. Look for the job automation tools in Claude Desktop")
-    safe_print("3. Test with: 'Extract form data from [job posting URL]'")
-    safe_print("4. Test job matching with: 'Find jobs matching my resume'")
-    safe_print("")
-    safe_print(f"📁 Config location: {config_file}")
-    safe_print("="*60)
 
 def show_success_message(config_file):
     """Show brief success message after successful setup."""
@@ -441,32 +423,37 @@ def main():
         safe_print("   job-automator-setup")
         sys.exit(1)
     
-    # Phase 2: Install playwright browsers if needed
+    # Phase 2: Start the Playwright browser install in the background.
+    # The download can take tens of seconds and the config writes below
+    # don't depend on it, so they run while it downloads
     safe_print("\n🎭 Installing Playwright browsers...")
+    pw_proc = None
     try:
-        run_command("playwright install chromium", "Installing Playwright browser")
-    except:
-        safe_print("⚠️  Playwright browser installation skipped (may already be installed)")
-    
+        pw_proc = subprocess.Popen(["playwright", "install", "chromium"],
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as e:
+        safe_print(f"⚠️  Could not start Playwright browser installation: {e}")
+
     # Phase 3: Set up Claude Desktop configuration
     safe_print("\n🔧 Configuring Claude Desktop MCP servers...")
     
     mcp_command, config_file = setup_claude_desktop_config()
-    
-    # Set up job-automator (core functionality)
-    automator_success = setup_job_automator_server(mcp_command, config_file)
-    
-    if not automator_success:
-        safe_print("\n❌ SETUP FAILED: Could not configure job-automator MCP server")
-        sys.exit(1)
-    
-    # Set up job-matcher (enhanced functionality)
-    matcher_success = setup_job_matcher_server(config_file)
-    
-    if not matcher_success:
-        safe_print("\n❌ SETUP FAILED: Could not configure job-matcher MCP server")
+
+    # Set up both servers with one config read/write
+    if not setup_mcp_servers(mcp_command, config_file):
+        safe_print("\n❌ SETUP FAILED: Could not configure MCP servers")
         sys.exit(1)
-    
+
+    # Join the background Playwright install before declaring success
+    if pw_proc is not None:
+        _, stderr = pw_proc.communicate()
+        if pw_proc.returncode == 0:
+            safe_print("✅ Playwright browser installation completed")
+        else:
+            safe_print("⚠️  Playwright browser installation skipped (may already be installed)")
+            if stderr:
+                safe_print(f"Error output: {stderr.decode('utf-8', errors='replace')}")
+
     # Phase 4: Show success message
     show_success_message(config_file)
 
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Shared prerequisite helpers for the setup scripts
+Keeps the Python version check in one place for check_prerequisites.py and quick_setup.py
+"""
+
+import sys
+
+# Evaluated once at import — the running interpreter's version cannot
+# change, so there is nothing to re-check per call
+PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+PYTHON_OK = sys.version_info >= (3, 10)
+
+def check_python():
+    """Return True when the running interpreter satisfies the 3.10+ floor."""
+    return PYTHON_OK
@@ -4,151 +4,160 @@ Quick setup script for Job Application Automator MCP Server
 Cross-platform installer that handles everything automatically
 """
 
-import subprocess
+import asyncio
 import sys
-import os
-import platform
 from pathlib import Path
 
-def run_command(command, description, shell=False):
-    """Run a command and handle errors."""
+from _prereq_common import PYTHON_OK, PYTHON_VERSION
+
+# Shared cache-backed probes from the prerequisites checker: when
+# check_prerequisites.py already ran, its on-disk results are reused here
+# instead of spawning node/npm again
+import check_prerequisites as _prereq
+
+async def run_command_async(command, description, timeout=300):
+    """Run a command on the event loop, streaming its output live."""
     print(f"📦 {description}...")
+    process = None
     try:
-        if isinstance(command, str) and not shell:
+        if isinstance(command, str):
             command = command.split()
-        
-        result = subprocess.run(
-            command, 
-            shell=shell, 
-            check=True, 
-            capture_output=True, 
-            text=True,
-            timeout=300  # 5 minute timeout
+
+        # Lines are shown as they arrive, so a long pip or playwright run
+        # gives live progress and its output never accumulates in memory
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
         )
-        print(f"✅ {description} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed: {e}")
-        if e.stderr:
-            print(f"Error output: {e.stderr}")
+
+        async def _stream_and_wait():
+            async for line in process.stdout:
+                sys.stdout.write(line.decode('utf-8', errors='replace'))
+            return await process.wait()
+
+        returncode = await asyncio.wait_for(_stream_and_wait(), timeout)  # 5 minute default
+
+        if returncode == 0:
+            print(f"✅ {description} completed successfully")
+            return True
+        print(f"❌ {description} failed with exit code {returncode}")
         return False
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
         print(f"❌ {description} timed out")
         return False
     except Exception as e:
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
         print(f"❌ {description} failed with unexpected error: {e}")
         return False
 
 def check_python():
     """Check Python version."""
-    try:
-        version = sys.version_info
-        if version >= (3, 10):
-            print(f"✅ Python {version.major}.{version.minor}.{version.micro} - OK")
-            return True
-        else:
-            print(f"❌ Python {version.major}.{version.minor}.{version.micro} - Requires Python 3.10+")
-            return False
-    except Exception as e:
-        print(f"❌ Python check failed: {e}")
-        return False
-
-def check_node():
-    """Check Node.js availability (optional)."""
-    try:
-        result = subprocess.run(
-            ["node", "--version"], 
-            capture_output=True, 
-            text=True, 
-            timeout=10
-        )
-        if result.returncode == 0:
-            version = result.stdout.strip()
-            print(f"✅ Node.js {version} - OK")
-            return True
-    except Exception:
-        pass
-    
-    print("⚠️  Node.js not found - some features may be limited")
+    if PYTHON_OK:
+        print(f"✅ Python {PYTHON_VERSION} - OK")
+        return True
+    print(f"❌ Python {PYTHON_VERSION} - Requires Python 3.10+")
     return False
 
-def main():
-    """Main setup function."""
-    print("🚀 Job Application Automator - Quick Setup")
-    print("=" * 60)
-    print()
-    
-    # Check prerequisites
-    print("🔧 Checking prerequisites...")
-    
-    if not check_python():
-        print("\n❌ SETUP FAILED: Python 3.10+ is required")
-        print("Please install Python 3.10 or higher from https://python.org/")
-        sys.exit(1)
-    
-    node_available = check_node()
-    
-    print()
-    
-    # Step 1: Install package and dependencies
+# The node/npm probe lives in check_prerequisites so both scripts share
+# one implementation and one result cache
+check_node = _prereq.check_node
+
+async def _install_package():
+    """Pip self-upgrade, then the project install (ordered: same env)."""
     print("📦 Installing package and dependencies...")
-    
+
     # Upgrade pip first
-    if not run_command([sys.executable, "-m", "pip", "install", "--upgrade", "pip"], "Upgrading pip"):
+    if not await run_command_async([sys.executable, "-m", "pip", "install", "-q", "--upgrade", "pip"], "Upgrading pip"):
         print("⚠️  Pip upgrade failed, continuing anyway...")
-    
+
     # Get the project root directory (parent of scripts/)
     project_root = Path(__file__).parent.parent
-    
+
     # Install the package from the project directory
-    if not run_command([sys.executable, "-m", "pip", "install", str(project_root)], "Installing job-application-automator"):
+    if not await run_command_async([sys.executable, "-m", "pip", "install", "-q", str(project_root)], "Installing job-application-automator"):
         print("❌ Package installation failed")
         print(f"❌ Tried to install from: {project_root}")
         print("❌ Make sure you're running this from the project directory")
-        sys.exit(1)
-    
-    # Step 2: Install Playwright browsers
+        return False
+    return True
+
+async def _install_playwright():
+    """Download the Chromium browser (needs only the package install)."""
     print("\n🎭 Installing Playwright browsers...")
-    playwright_success = run_command(
-        [sys.executable, "-m", "playwright", "install", "chromium"], 
+    success = await run_command_async(
+        [sys.executable, "-m", "playwright", "install", "chromium"],
         "Installing Chromium browser"
     )
-    
-    if not playwright_success:
+    if not success:
         print("⚠️  Playwright installation failed - you may need to install manually:")
         print("   playwright install chromium")
-    
-    # Step 3: Configure Claude Desktop
+    return success
+
+async def _setup_claude():
+    """Configure Claude Desktop (needs only the package install)."""
     print("\n🔧 Configuring Claude Desktop...")
-    
-    # Try using the installed script first
-    claude_setup_success = False
-    
-    try:
-        # Method 1: Use installed command
-        claude_setup_success = run_command(
-            ["job-automator-setup"], 
-            "Configuring Claude Desktop MCP server"
-        )
-    except Exception:
-        pass
-    
-    if not claude_setup_success:
-        try:
-            # Method 2: Run setup script directly
-            setup_script = Path(__file__).parent.parent / "job_application_automator" / "setup_claude.py"
-            if setup_script.exists():
-                claude_setup_success = run_command(
-                    [sys.executable, str(setup_script)], 
-                    "Configuring Claude Desktop MCP server (direct)"
-                )
-        except Exception:
-            pass
-    
-    if not claude_setup_success:
+
+    # Method 1: Use installed command
+    success = await run_command_async(
+        ["job-automator-setup"],
+        "Configuring Claude Desktop MCP server"
+    )
+
+    if not success:
+        # Method 2: Run setup script directly
+        setup_script = Path(__file__).parent.parent / "job_application_automator" / "setup_claude.py"
+        if setup_script.exists():
+            success = await run_command_async(
+                [sys.executable, str(setup_script)],
+                "Configuring Claude Desktop MCP server (direct)"
+            )
+
+    if not success:
         print("⚠️  Claude Desktop configuration may need manual setup")
         print("   Run: job-automator-setup")
+    return success
+
+async def _run_pipeline():
+    """Drive the install DAG: pip upgrade -> package install, then the
+    Chromium download and Claude Desktop config in parallel."""
+    if not await _install_package():
+        return None
+    return await asyncio.gather(_install_playwright(), _setup_claude())
+
+def main():
+    """Main setup function."""
+    print("🚀 Job Application Automator - Quick Setup")
+    print("=" * 60)
+    print()
     
+    # Check prerequisites
+    print("🔧 Checking prerequisites...")
+    
+    if not check_python():
+        print("\n❌ SETUP FAILED: Python 3.10+ is required")
+        print("Please install Python 3.10 or higher from https://python.org/")
+        sys.exit(1)
+    
+    node_available = check_node()
+
+    # Persist any fresh probe results for later runs of either script
+    _prereq._save_cache(_prereq._cache)
+
+    print()
+
+    # Steps 1-3 as a small dependency DAG on one event loop: the pip
+    # steps chain, then the Chromium download and the Claude Desktop
+    # config — which don't depend on each other — run in parallel
+    results = asyncio.run(_run_pipeline())
+    if results is None:
+        sys.exit(1)
+    playwright_success, claude_setup_success = results
+
     # Step 4: Success message
     print("\n" + "=" * 60)
     print("🎉 Setup Complete!")